@@ -1,12 +1,21 @@
 # -*- coding: utf-8 -*-
 from PySide6.QtWidgets import (QApplication)
-from PySide6.QtCore import (Qt)
+from PySide6.QtCore import (Qt, QSettings)
 from PySide6.QtGui import (QPixmap, QPainter, QIcon, QFont)
 import numpy as np
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 import re
+from functools import lru_cache
+import json
+import os
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # -------------------- 常量 --------------------
 FRAME_WIDTH = 64
 FRAME_HEIGHT = 64
@@ -18,6 +27,16 @@ CONTROL_BAR_HEIGHT = 70
 FADE_DURATION = 5
 AUTO_CONNECT_DELAY_MS = 100
 LISTEN_PORT = 50000
+SETTINGS_SAVE_DELAY_MS = 250  # 设置写入去抖间隔
+LOG_FLUSH_INTERVAL_MS = 100  # 界面日志批量刷新间隔
+LOG_MAX_BLOCKS = 1000  # 界面日志保留条数
+FRAME_LABEL_INTERVAL_MS = 100  # 采集帧数标签最小刷新间隔
+FPS_WINDOW_FRAMES = 60  # 实测FPS滚动窗口帧数
+COORD_FLUSH_COUNT = 30  # 采集坐标/FPS批量并入回放列表的条数
+COORD_FLUSH_INTERVAL_MS = 500  # 采集坐标/FPS批量并入回放列表的最长间隔
+FRAME_POOL_MAX_BYTES = 256 * 1024 ** 2  # 采集缓冲区池保留的空闲内存上限
+FRAME_SAVE_QUEUE_SIZE = 64  # 后台帧保存队列上限（超出时丢弃最早的待保存帧）
+GC_THRESHOLDS = (50_000, 10, 10)  # 长时间运行的UI：放宽第0代回收阈值，减少渲染路径上的停顿
 LOGO_PATH = r"C:\logo.png"
 LOG_DEBUG, LOG_INFO, LOG_WARNING, LOG_ERROR = 0, 1, 2, 3
 LOG_CONFIG = (2, 2, 2, 2)
@@ -29,8 +48,13 @@ LOG_LEVEL_MAP = {
 }
 # 坐标维度常量
 COORD_DIMENSION = 12  # 12维坐标 (x,y,z,roll,pitch,yaw,vx,vy,vz,vroll,vpitch,vyaw)
+COORD_RING_SIZE = 256  # 坐标环形缓冲区行数
 # 会话文件常量
 SESSION_PARAMS_FILE = "processing_params.json"
+SESSION_FRAMES_B2ND_FILE = "frames.b2nd"  # blosc2压缩帧数据
+SESSION_FRAMES_NPZ_FILE = "frames.npz"  # 无blosc2时的回退格式
+SESSION_LOG_FILE = "session_log.ndjson"  # 会话日志（每行一条JSON，随记录追加写盘）
+SESSION_LOG_MAX_ENTRIES = 1000  # 会话日志在内存中保留的最近条数
 # -------------------- 自动切换阈值常量 --------------------
 AUTO_SWITCH_THRESHOLD_MS = 100.0
 FPS_DIFF_THRESHOLD = 5.0
@@ -50,6 +74,75 @@ def create_icon(text: str, color):
 def sanitize_path(path: str) -> str:
     return re.sub(r'[<>"|?*\x00-\x1F]', '_', path)
 
+def _json_default(obj):
+    """标准库json的回退序列化：numpy数组/标量转为Python原生类型"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"无法序列化类型: {type(obj).__name__}")
+
+def dump_json(path, obj):
+    """写JSON文件（优先orjson，可直接序列化numpy数组；缩进2格，中文不转义；整块字节一次写入）"""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode('utf-8')
+    Path(path).write_bytes(data)
+
+def json_line(obj) -> bytes:
+    """序列化为单行JSON字节（含换行），用于NDJSON追加写入"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(obj, ensure_ascii=False, default=_json_default) + "\n").encode('utf-8')
+
+def load_json(path):
+    """读JSON文件（优先orjson）"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+SETTINGS_ORGANIZATION, SETTINGS_APPLICATION = "T-Waves", "THZDetector"
+
+def open_settings() -> QSettings:
+    """打开应用配置：统一使用INI文件（Windows下不再逐键写注册表，sync时整文件写一次）"""
+    return QSettings(QSettings.IniFormat, QSettings.UserScope, SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+
+def migrate_native_settings():
+    """把原生格式（注册表/plist）中的旧配置一次性迁移到INI；启动时调用
+
+    以 meta/migrated 标记判断是否已迁移；迁移后清空原生存储，
+    这样“恢复默认设置”清空INI（连同标记）后也不会把旧配置再复制回来
+    """
+    settings = open_settings()
+    if settings.value("meta/migrated", False, type=bool):
+        return
+    legacy = QSettings(SETTINGS_ORGANIZATION, SETTINGS_APPLICATION)
+    for key in legacy.allKeys():
+        if not settings.contains(key):
+            settings.setValue(key, legacy.value(key))
+    settings.setValue("meta/migrated", True)
+    settings.sync()
+    if settings.status() == QSettings.NoError:
+        legacy.clear()
+        legacy.sync()
+
+_psutil_process = None
+
+def read_rss_bytes() -> int:
+    """当前进程常驻内存（字节）：Linux直接读 /proc/self/statm，其他平台用缓存的 psutil.Process"""
+    global _psutil_process
+    if sys.platform.startswith('linux'):
+        fd = os.open('/proc/self/statm', os.O_RDONLY)
+        try:
+            fields = os.read(fd, 128).split()
+        finally:
+            os.close(fd)
+        return int(fields[1]) * os.sysconf('SC_PAGE_SIZE')
+    if _psutil_process is None:
+        import psutil
+        _psutil_process = psutil.Process()
+    return _psutil_process.memory_info().rss
+
 def create_session_folder(coords: np.ndarray, base_path: Path, params: Dict[str, Any]) -> Path:
     """创建会话文件夹，返回完整路径"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -80,6 +173,7 @@ def create_save_session_folder(coords: np.ndarray, base_path: Path) -> Path:
     session_path.mkdir(parents=True, exist_ok=True)
     return session_path
 
+@lru_cache(maxsize=None)
 def _get_button_style():
     palette = QApplication.palette()
     highlight_color = palette.highlight().color().name()
@@ -92,6 +186,7 @@ def _get_button_style():
         QPushButton:disabled {{ background-color: #e0e0e0; color: #999999; border-color: #d0d0d0; }}
     """
 
+@lru_cache(maxsize=None)
 def _get_slider_style():
     palette = QApplication.palette()
     highlight_color = palette.highlight().color().name()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+from PySide6.QtCore import QSettings
+from typing import Any, Dict, Optional
+
+from SettingsWriter import SettingsWriter
+
+_MISSING = object()
+
+
+# -------------------- 带内存缓存的配置读写 --------------------
+class CachedSettings:
+    """
+    QSettings 包装：读取时首次访问才读后端并缓存，写入时值未变化则不转发
+
+    键使用完整路径（如 "processing/contrast"），不支持 beginGroup/endGroup
+    传入 writer 时写入/清空/sync 交给后台线程执行，本对象只负责读取
+    """
+
+    def __init__(self, settings: QSettings, writer: Optional[SettingsWriter] = None):
+        self._settings = settings
+        self._writer = writer
+        # 键 -> {type: 值}；type 为 None 表示原始值，_MISSING 表示后端无此键
+        self._cache: Dict[str, Dict[Any, Any]] = {}
+
+    def value(self, key: str, defaultValue: Any = None, type: Any = None) -> Any:
+        entry = self._cache.setdefault(key, {})
+        if type not in entry:
+            if None in entry:
+                raw = entry[None]
+                if raw is _MISSING:
+                    return defaultValue
+                # 刚写入的值可能尚未被后台线程落到后端，类型匹配时直接返回
+                if type is not None and isinstance(raw, type):
+                    return raw
+            if not self._settings.contains(key):
+                entry[None] = _MISSING
+                return defaultValue
+            entry[type] = self._settings.value(key) if type is None else self._settings.value(key, type=type)
+        return entry[type]
+
+    def setValue(self, key: str, value: Any):
+        entry = self._cache.get(key)
+        if entry is not None and None in entry and entry[None] is not _MISSING:
+            try:
+                if entry[None] == value:
+                    return
+            except Exception:
+                pass
+        if self._writer is not None:
+            self._writer.enqueue(key, value)
+        else:
+            self._settings.setValue(key, value)
+        self._cache[key] = {None: value}
+
+    def contains(self, key: str) -> bool:
+        return self.value(key, _MISSING) is not _MISSING
+
+    def clear(self):
+        if self._writer is not None:
+            self._writer.request_clear()
+            # 后台清空完成前后端仍可能读到旧值，先把已知键标记为缺失
+            keys = set(self._settings.allKeys()) | set(self._cache)
+            self._cache = {key: {None: _MISSING} for key in keys}
+        else:
+            self._settings.clear()
+            self._cache.clear()
+
+    def sync(self):
+        if self._writer is not None:
+            self._writer.request_sync()
+        else:
+            self._settings.sync()
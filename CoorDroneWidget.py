@@ -12,6 +12,51 @@ import OpenGL.GL as gl
 
 from C import COORD_DIMENSION
 
+try:
+    from numba import njit
+except ImportError:
+    # 未安装numba时退化为普通Python函数
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+def _predict(x, P, F, Q):
+    """卡尔曼预测步骤：返回先验状态和先验协方差"""
+    x_prior = np.dot(F, x)
+    P_prior = np.dot(np.dot(F, P), F.T) + Q
+    return x_prior, P_prior
+
+def _update(x, P, z, H, R):
+    """卡尔曼更新步骤：x、P为先验值，返回后验状态和后验协方差"""
+    y = z - np.dot(H, x)  # 测量残差（实际与预测的差值）
+    S = np.dot(np.dot(H, P), H.T) + R  # 残差协方差
+    K = np.dot(np.dot(P, H.T), np.linalg.inv(S))  # 卡尔曼增益
+    x_post = x + np.dot(K, y)
+    P_post = np.dot(np.eye(P.shape[0]) - np.dot(K, H), P)
+    return x_post, P_post
+
+_predict_njit = njit(cache=True, fastmath=True)(_predict)
+_update_njit = njit(cache=True, fastmath=True)(_update)
+# 滤波器实际调用的实现：默认numpy版本，JIT预热成功后切换
+_kalman_predict, _kalman_update = _predict, _update
+
+def warmup_kalman_kernels() -> bool:
+    """用空数据调用一次JIT函数，提前完成编译，避免首帧卡顿；编译失败时保留numpy实现并返回False"""
+    global _kalman_predict, _kalman_update
+    n = COORD_DIMENSION
+    x = np.zeros(n)
+    P = np.eye(n)
+    H = np.eye(6, n)
+    try:
+        x_prior, P_prior = _predict_njit(x, P, np.eye(n), np.eye(n))
+        _update_njit(x_prior, P_prior, np.zeros(6), H, np.eye(6))
+    except Exception:
+        # numba 的 np.dot/np.linalg 依赖 scipy，缺失时抛 ImportError/TypingError
+        return False
+    _kalman_predict, _kalman_update = _predict_njit, _update_njit
+    return True
+
 class CoordinatePredictor:
     """12维卡尔曼滤波器用于预测无人机坐标
     状态向量（12维）: [x, y, z, roll, pitch, yaw, vx, vy, vz, vroll, vpitch, vyaw]
@@ -138,21 +183,12 @@ class CoordinatePredictor:
             if self.log_callback:
                 self.log_callback("坐标重复，增大观测噪声，信任预测值")
         # ===== 预测步骤 =====
-        # 预测下一时刻的状态
-        x_prior = self.A @ self.x
-        # 预测下一时刻的协方差
-        P_prior = self.A @ self.P @ self.A.T + self.Q
+        x_prior, P_prior = _kalman_predict(self.x, self.P, self.A, self.Q)
         if self.log_callback:
             self.log_callback(f"预测: pos=({x_prior[0]:.3f}, {x_prior[1]:.3f}, {x_prior[2]:.3f})")
         # ===== 更新步骤 =====
-        z = measurement  # 当前测量值
-        y = z - self.H @ x_prior  # 测量残差（实际与预测的差值）
-        S = self.H @ P_prior @ self.H.T + self.R  # 残差协方差
-        K = P_prior @ self.H.T @ np.linalg.inv(S)  # 卡尔曼增益
-        # 更新状态估计
-        self.x = x_prior + K @ y
-        # 更新协方差估计
-        self.P = (np.eye(self.state_dim) - K @ self.H) @ P_prior
+        z = np.asarray(measurement, dtype=np.float64)  # 当前测量值
+        self.x, self.P = _kalman_update(x_prior, P_prior, z, self.H, self.R)
         # 保存历史状态
         self.state_history.append(self.x.copy())
         # 记录日志
@@ -181,13 +217,18 @@ class CoordinatePredictor:
             x_pred = self.A @ x_pred
         return x_pred[:6].copy()  # 只返回位置和姿态
 
-    def get_current_state(self) -> np.ndarray:
+    def get_current_state(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         获取当前状态
+        输入参数:
+            out: np.ndarray - 可选，12维输出数组；给定时直接写入，不分配新数组
         返回值:
             np.ndarray - 12维当前状态向量（完整状态）
         """
-        return self.x.copy()
+        if out is None:
+            return self.x.copy()
+        np.copyto(out, self.x)
+        return out
 
 # -------------------- 无人机3D可视化 --------------------
 class DroneWidget(QOpenGLWidget):
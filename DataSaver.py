@@ -1,18 +1,22 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 import cv2
-import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Deque, BinaryIO
+import collections
 
-from C import sanitize_path, create_session_folder, LOG_ERROR, LOG_INFO, SESSION_PARAMS_FILE
+from C import sanitize_path, create_session_folder, LOG_ERROR, LOG_INFO, SESSION_PARAMS_FILE, dump_json, \
+    SESSION_LOG_FILE, SESSION_LOG_MAX_ENTRIES, json_line
 
 class DataSaver:
     def __init__(self, base_path: Path):
         self.base_path = Path(sanitize_path(str(base_path)))
         self.current_session_path: Optional[Path] = None
-        self.log_messages: List[Dict[str, Any]] = []
+        # 内存中只保留最近的日志，完整日志在会话启动后逐条追加到 NDJSON 文件
+        self.log_messages: Deque[Dict[str, Any]] = collections.deque(maxlen=SESSION_LOG_MAX_ENTRIES)
+        self.log_path: Optional[Path] = None
+        self._log_file: Optional[BinaryIO] = None
         self.processing_params: Dict[str, Any] = {}
 
     def set_processing_params(self, params: Dict[str, Any]):
@@ -21,12 +25,19 @@ class DataSaver:
 
     def log(self, module: str, message: str, level: int = LOG_INFO):
         timestamp = datetime.now().isoformat()
-        self.log_messages.append({"timestamp": timestamp, "module": module, "level": level, "message": message})
+        entry = {"timestamp": timestamp, "module": module, "level": level, "message": message}
+        self.log_messages.append(entry)
+        if self._log_file is not None:
+            self._log_file.write(json_line(entry))
 
     def start_session(self, coords: np.ndarray, params: Dict[str, Any]) -> bool:
         """启动新会话，创建文件夹"""
         try:
             self.current_session_path = create_session_folder(coords, self.base_path, params)
+            # 打开会话日志文件，先补写会话启动前的记录
+            self.log_path = self.current_session_path / SESSION_LOG_FILE
+            self._log_file = open(self.log_path, 'ab')
+            self._log_file.write(b"".join(json_line(entry) for entry in self.log_messages))
             self.log("保存", f"会话已启动: {self.current_session_path}", LOG_INFO)
             return True
         except Exception as e:
@@ -75,12 +86,11 @@ class DataSaver:
                 "timestamp": datetime.now().isoformat(),
                 "coordinates": coord_data,
                 "push_fps": fps,  # 添加推送端FPS信息
-                "raw_data": raw_data.tolist(),
+                "raw_data": raw_data,
                 "shape": raw_data.shape,
                 "dtype": str(raw_data.dtype)
             }
-            with open(raw_data_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            dump_json(raw_data_path, json_data)
             if frame_num % 10 == 0:
                 self.log("保存", f"已保存帧 {frame_num:06d}", LOG_INFO)
             return True
@@ -91,10 +101,11 @@ class DataSaver:
     def save_calibration_file(self, all_frames: List[np.ndarray], base_path: Path) -> bool:
         """保存校准文件（平均帧）- 修复路径问题"""
         try:
-            if not all_frames:
+            if len(all_frames) == 0:
                 return False
-            # 计算所有帧的平均值
-            avg_frame = np.mean(all_frames, axis=0).astype(np.uint8)
+            # 计算所有帧的平均值：uint32整数求和无舍入，再按float64相除，与 np.mean 的结果逐位一致
+            frame_sum = np.add.reduce(all_frames, axis=0, dtype=np.uint32)
+            avg_frame = (frame_sum / len(all_frames)).astype(np.uint8)
             # 保存为与base_path文件夹同名的文件，保存在base_path目录下
             folder_name = base_path.name
             json_path = base_path / f"{folder_name}.json"
@@ -102,12 +113,11 @@ class DataSaver:
             # 保存JSON（包含平均数据）
             json_data = {
                 "timestamp": datetime.now().isoformat(),
-                "average_data": avg_frame.tolist(),
+                "average_data": avg_frame,
                 "shape": avg_frame.shape,
                 "dtype": str(avg_frame.dtype)
             }
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            dump_json(json_path, json_data)
             # 保存PNG（无图像处理效果）
             is_success, buffer = cv2.imencode('.png', avg_frame)
             if is_success:
@@ -124,18 +134,17 @@ class DataSaver:
             if self.current_session_path:
                 # 保存处理参数
                 params_path = self.current_session_path / SESSION_PARAMS_FILE
-                with open(params_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.processing_params, f, ensure_ascii=False, indent=2)
-                # 保存日志
-                log_file_path = self.current_session_path / "session_log.json"
-                with open(log_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.log_messages, f, ensure_ascii=False, indent=2)
-                self.log("保存", f"会话已结束，日志保存到: {log_file_path}", LOG_INFO)
+                dump_json(params_path, self.processing_params)
+                # 日志已逐条写入，这里只记录结束信息并关闭文件
+                self.log("保存", f"会话已结束，日志保存到: {self.log_path}", LOG_INFO)
                 return True
         except Exception as e:
             self.log("保存", f"结束会话失败: {e}", LOG_ERROR)
             return False
         finally:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
             self.current_session_path = None
             self.log_messages.clear()
             self.processing_params.clear()
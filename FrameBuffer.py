@@ -9,19 +9,43 @@ class FrameBuffer:
     def __init__(self, max_size: int = MAX_RECORDED_FRAMES):
         self.buffer: collections.deque[np.ndarray] = collections.deque(maxlen=max_size)
         self.reference_frame: Optional[np.ndarray] = None
+        # 累加窗口的滑动和（uint32整数累加）：新帧加入时加上新帧、减去移出窗口的帧，O(H*W)
+        self._accum_sum: Optional[np.ndarray] = None
+        self._accum_window = 0
+        # 平均结果输出缓冲区，逐帧复用
+        self._accum_out: Optional[np.ndarray] = None
 
     def add_frame(self, frame: np.ndarray):
+        if self._accum_sum is not None:
+            window = self._accum_window
+            if len(self.buffer) >= window:
+                self._accum_sum -= self.buffer[-window]  # 移出窗口的帧
+            self._accum_sum += frame
         self.buffer.append(frame)
 
     def get_accumulated_frame(self, accumulate_count: int) -> np.ndarray:
         if accumulate_count <= 1 or not self.buffer:
             return self.buffer[-1] if self.buffer else np.zeros((FRAME_HEIGHT, FRAME_WIDTH), dtype=np.uint8)
-        count = min(accumulate_count, len(self.buffer))
-        return np.mean(list(self.buffer)[-count:], axis=0).astype(np.uint8)
+        window = min(accumulate_count, self.buffer.maxlen)
+        if self._accum_sum is None or self._accum_window != window:
+            # 窗口大小变化时重建一次滑动和
+            self._accum_sum = np.sum(list(self.buffer)[-window:], axis=0, dtype=np.uint32)
+            self._accum_window = window
+        if self._accum_out is None or self._accum_out.shape != self._accum_sum.shape:
+            self._accum_out = np.empty(self._accum_sum.shape, dtype=np.uint8)
+        count = min(window, len(self.buffer))
+        np.floor_divide(self._accum_sum, count, out=self._accum_out, casting='unsafe')
+        return self._accum_out
 
     def set_reference(self, frame: np.ndarray):
-        self.reference_frame = frame.copy()
+        # 只读视图代替整帧拷贝；参考帧只用于差分，不应被修改
+        ref = frame.view()
+        ref.flags.writeable = False
+        self.reference_frame = ref
 
     def clear(self):
         self.buffer.clear()
-        self.reference_frame = None
\ No newline at end of file
+        self.reference_frame = None
+        self._accum_sum = None
+        self._accum_window = 0
+        self._accum_out = None
\ No newline at end of file
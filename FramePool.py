@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from typing import Dict, List, Tuple
+
+from C import FRAME_POOL_MAX_BYTES
+
+
+# -------------------- 帧缓冲区池 --------------------
+class FramePool:
+    """
+    按 (shape, dtype) 复用采集缓冲区，会话之间不再重新分配大块内存
+
+    空闲缓冲区总字节数有上限，超出时直接丢弃（交还给分配器）
+    """
+
+    def __init__(self, max_free_bytes: int = FRAME_POOL_MAX_BYTES):
+        self.max_free_bytes = max_free_bytes
+        self._free: Dict[Tuple[Tuple[int, ...], np.dtype], List[np.ndarray]] = {}
+        self._free_bytes = 0
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """取出一块指定形状的缓冲区（内容未初始化），池中没有时新分配"""
+        key = (tuple(shape), np.dtype(dtype))
+        bucket = self._free.get(key)
+        if bucket:
+            buf = bucket.pop()
+            self._free_bytes -= buf.nbytes
+            return buf
+        return np.empty(key[0], dtype=key[1])
+
+    def release(self, buf: np.ndarray):
+        """归还缓冲区；非独立内存块或超出池容量时不回收"""
+        if buf is None or buf.base is not None or not buf.flags.c_contiguous:
+            return
+        if self._free_bytes + buf.nbytes > self.max_free_bytes:
+            return
+        self._free.setdefault((buf.shape, buf.dtype), []).append(buf)
+        self._free_bytes += buf.nbytes
+
+    def clear(self):
+        self._free.clear()
+        self._free_bytes = 0
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from PySide6.QtCore import QThread
+import numpy as np
+import queue
+
+from C import FRAME_SAVE_QUEUE_SIZE
+from DataSaver import DataSaver
+
+
+# -------------------- 后台帧保存线程 --------------------
+class FrameSaver(QThread):
+    """
+    在独立线程中执行 DataSaver.save_frame（PNG编码与JSON写盘），GUI线程只负责入队
+
+    队列有界：磁盘跟不上时丢弃最旧的待保存帧，enqueue 返回 False 以便调用方告警
+    """
+    _STOP = object()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue: "queue.Queue" = queue.Queue(maxsize=FRAME_SAVE_QUEUE_SIZE)
+
+    def enqueue(self, saver: DataSaver, processed_img: np.ndarray, raw_data: np.ndarray, frame_num: int,
+                coords: np.ndarray, fps: float) -> bool:
+        """入队一帧；队列已满时丢弃最旧的一帧并返回False"""
+        item = (saver, processed_img, raw_data, frame_num, coords, fps)
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+        try:
+            self._queue.get_nowait()
+            self._queue.task_done()
+        except queue.Empty:
+            pass
+        self._queue.put(item)
+        return False
+
+    def wait_idle(self):
+        """阻塞直到已入队的帧全部写完（结束会话前调用）"""
+        if self.isRunning():
+            self._queue.join()
+
+    def stop(self):
+        """投递结束标记并等待剩余帧写完"""
+        if self.isRunning():
+            self._queue.put(self._STOP)
+            self.wait()
+
+    def run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                saver, *args = item
+                saver.save_frame(*args)
+            finally:
+                self._queue.task_done()
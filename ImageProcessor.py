@@ -2,11 +2,90 @@
 from PySide6.QtGui import (QImage, QPixmap)
 import numpy as np
 import cv2
-import json
-from pathlib import Path
-from typing import Dict, Any
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
-from C import DISPLAY_SIZE, FRAME_HEIGHT, FRAME_WIDTH, LOG_ERROR, LOG_INFO
+from C import DISPLAY_SIZE, FRAME_HEIGHT, FRAME_WIDTH, LOG_ERROR, LOG_INFO, load_json
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # 未安装numba时走NumPy/OpenCV路径（不调用下面的JIT函数）
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+_IDENTITY_LUT = np.arange(256, dtype=np.uint8)
+_IDENTITY_LUT.flags.writeable = False  # 与缓存的伽马表一致为只读，JIT只编译一种签名
+
+@lru_cache(maxsize=64)
+def _gamma_table(gamma: float) -> np.ndarray:
+    """伽马查找表（256项uint8），按伽马值缓存，逐帧只做一次cv2.LUT
+
+    逐项标量幂运算与原实现一致：向量化 np.power 在部分CPU上走SVML，末位误差可能改变截断结果
+    """
+    inv_gamma = 1.0 / gamma
+    table = np.array([((i / 255.0) ** inv_gamma) * 255 for i in range(256)]).astype(np.uint8)
+    table.flags.writeable = False  # 缓存共享，禁止调用方修改
+    return table
+
+@njit(parallel=True, cache=True)
+def _tone_map_njit(img, contrast, brightness, lut, out):
+    """对比度/亮度/截断/伽马查表融合为单次逐像素遍历（按行并行）
+
+    按float64先乘后加、不开fastmath（避免合并为FMA），结果与NumPy路径逐位一致
+    """
+    h, w = img.shape
+    for y in prange(h):
+        for x in range(w):
+            v = np.float64(img[y, x]) * contrast + brightness
+            if v < 0.0:
+                v = 0.0
+            elif v > 255.0:
+                v = 255.0
+            out[y, x] = lut[int(v)]
+    return out
+
+def opencv_optimized() -> bool:
+    """缩放/模糊/伪彩色均走OpenCV；其SSE/AVX优化内核默认开启，返回当前是否启用"""
+    return cv2.useOptimized()
+
+def warmup_image_kernels() -> bool:
+    """用128x128空图调用一次JIT函数，提前完成编译，避免首帧卡顿；编译失败时改走NumPy路径并返回False"""
+    global HAS_NUMBA
+    if not HAS_NUMBA:
+        return True
+    img = np.zeros((128, 128), dtype=np.uint8)
+    try:
+        _tone_map_njit(img, np.float64(1.0), np.float64(0.0), _IDENTITY_LUT, np.empty_like(img))
+    except Exception:
+        HAS_NUMBA = False
+        return False
+    return True
+
+@dataclass(frozen=True)
+class ProcParams:
+    """图像处理参数快照：控件信号触发时整体刷新，逐帧处理只读字段"""
+    diff_mode: str = '关闭'
+    use_median: bool = False
+    contrast: float = 1.0
+    brightness: int = 0
+    colormap: str = 'JET'
+    interpolation: str = '无'
+    gamma: float = 1.0
+    sharpen: float = 0.0
+    gaussian_blur: float = 0.0
+    bilateral_filter: int = 0
+    edge_detection: str = '无'
+    accumulate: int = 1
+    advanced_enable: bool = False
 
 class ImageProcessor:
     def __init__(self, log_callback=None):
@@ -14,6 +93,17 @@ class ImageProcessor:
         # ==================== 新增：初始化高级处理器 ====================
         self.advanced_processor = AdvancedImageProcessor(log_callback)
         # ==================== 新增结束 ====================
+        # 显示缓冲区：持久的RGBA数组及包装它的QImage，尺寸变化时才重建
+        self._disp_buf: Optional[np.ndarray] = None
+        self._disp_qimage: Optional[QImage] = None
+        # 伪彩色查找表：(256, 3) uint8，仅在色图切换时重建
+        self._cmap_name: Optional[str] = None
+        self._cmap_lut: Optional[np.ndarray] = None
+        # 对比度/亮度运算的float64暂存区（与原流程精度一致，保证输出逐位相同），首帧时分配，尺寸变化时重建
+        self._scratch_f64: Optional[np.ndarray] = None
+        # 校准帧缓存：(路径, mtime, 大小) 不变时不重新读取和解析JSON
+        self._calib_key: Optional[tuple] = None
+        self._calib_frame: Optional[np.ndarray] = None
 
     COLORMAP_MAP = {
         "AUTUMN": cv2.COLORMAP_AUTUMN,
@@ -51,12 +141,49 @@ class ImageProcessor:
         "Laplacian": "laplacian"
     }
 
+    def to_display_pixmap(self, img_array: np.ndarray) -> QPixmap:
+        """将BGR图像写入持久显示缓冲区并生成QPixmap（避免逐帧分配QImage）"""
+        h, w = img_array.shape[:2]
+        if self._disp_buf is None or self._disp_buf.shape[:2] != (h, w):
+            self._disp_buf = np.empty((h, w, 4), dtype=np.uint8)
+            self._disp_qimage = QImage(self._disp_buf.data, w, h, w * 4, QImage.Format_RGBA8888)
+        code = cv2.COLOR_GRAY2RGBA if img_array.ndim == 2 else cv2.COLOR_BGR2RGBA
+        cv2.cvtColor(img_array, code, dst=self._disp_buf)
+        return QPixmap.fromImage(self._disp_qimage)
+
+    def _colormap_lut(self, colormap: str) -> np.ndarray:
+        """返回指定色图的 (256, 3) BGR 查找表，色图未变化时复用"""
+        if colormap != self._cmap_name:
+            ramp = np.arange(256, dtype=np.uint8).reshape(256, 1)
+            cmap = self.COLORMAP_MAP.get(colormap, cv2.COLORMAP_JET)
+            self._cmap_lut = np.ascontiguousarray(cv2.applyColorMap(ramp, cmap).reshape(256, 3))
+            self._cmap_name = colormap
+        return self._cmap_lut
+
     @staticmethod
-    def numpy_to_qpixmap(img_array: np.ndarray) -> QPixmap:
-        return QPixmap.fromImage(
-            QImage(img_array.data, img_array.shape[1], img_array.shape[0],
-                   3 * img_array.shape[1], QImage.Format_RGB888).rgbSwapped()
-        )
+    def _stat_calibration_file(path: Optional[str]) -> Optional[os.stat_result]:
+        """校准文件存在时返回其stat信息，否则返回None"""
+        if not path:
+            return None
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def calibration_key(self, path: Optional[str]) -> Optional[tuple]:
+        """校准文件的缓存键 (路径, 修改时间, 大小)，文件不存在时返回None；显示端用它判断校准帧是否变化"""
+        st = self._stat_calibration_file(path)
+        return None if st is None else (path, st.st_mtime_ns, st.st_size)
+
+    def _get_calibration_frame(self, path: str, st: os.stat_result) -> np.ndarray:
+        """读取校准帧；文件路径、修改时间和大小都未变化时直接复用上次解析结果"""
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key != self._calib_key:
+            calib_data = load_json(path)
+            calib_frame = np.array(calib_data['average_data'], dtype=np.uint8)
+            self._calib_frame = calib_frame.reshape((FRAME_HEIGHT, FRAME_WIDTH))
+            self._calib_key = key
+        return self._calib_frame
 
     @staticmethod
     def resize_image(data: np.ndarray, interpolation: int = cv2.INTER_CUBIC,
@@ -71,9 +198,7 @@ class ImageProcessor:
 
     @staticmethod
     def adjust_gamma(image: np.ndarray, gamma: float) -> np.ndarray:
-        inv_gamma = 1.0 / gamma
-        table = np.array([((i / 255.0) ** inv_gamma) * 255 for i in np.arange(0, 256)]).astype("uint8")
-        return cv2.LUT(image, table)
+        return cv2.LUT(image, _gamma_table(gamma))
 
     @staticmethod
     def sharpen_image(image: np.ndarray, amount: float) -> np.ndarray:
@@ -91,13 +216,13 @@ class ImageProcessor:
             edges = cv2.Canny(gray, low_threshold, high_threshold)
             return cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
         elif method == "sobel":
-            sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-            sobely = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+            sobelx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3)
+            sobely = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3)
             sobel = cv2.magnitude(sobelx, sobely)
             sobel = np.uint8(np.clip(sobel, 0, 255))
             return cv2.cvtColor(sobel, cv2.COLOR_GRAY2BGR)
         elif method == "laplacian":
-            laplacian = cv2.Laplacian(gray, cv2.CV_64F, ksize=3)
+            laplacian = cv2.Laplacian(gray, cv2.CV_32F, ksize=3)
             laplacian = np.uint8(np.clip(np.abs(laplacian), 0, 255))
             return cv2.cvtColor(laplacian, cv2.COLOR_GRAY2BGR)
         return image
@@ -108,26 +233,23 @@ class ImageProcessor:
         diff_mode = params.get('diff_mode', '关闭')
         if diff_mode == '打开':
             if params.get('ref_frame') is not None:
-                img = cv2.absdiff(img, params['ref_frame'])
+                cv2.absdiff(img, params['ref_frame'], dst=img)
         elif diff_mode == '校准文件':
             calibration_path = params.get('calibration_file_path')
-            if calibration_path and Path(calibration_path).exists():
+            calib_stat = self._stat_calibration_file(calibration_path)
+            if calib_stat is not None:
                 try:
-                    with open(calibration_path, 'r', encoding='utf-8') as f:
-                        calib_data = json.load(f)
-                        calib_frame = np.array(calib_data['average_data'], dtype=np.uint8)
-                        calib_frame = calib_frame.reshape((FRAME_HEIGHT, FRAME_WIDTH))
-                        img = cv2.absdiff(img, calib_frame)
+                    cv2.absdiff(img, self._get_calibration_frame(calibration_path, calib_stat), dst=img)
                 except Exception as e:
                     # 如果校准文件加载失败，回退到"打开"模式
                     if params.get('ref_frame') is not None:
-                        img = cv2.absdiff(img, params['ref_frame'])
+                        cv2.absdiff(img, params['ref_frame'], dst=img)
                     if self.log_callback:
                         self.log_callback("校准", f"校准文件加载失败: {e}", LOG_ERROR)
             else:
                 # 如果没有校准文件，回退到"打开"模式
                 if params.get('ref_frame') is not None:
-                    img = cv2.absdiff(img, params['ref_frame'])
+                    cv2.absdiff(img, params['ref_frame'], dst=img)
                 if self.log_callback:
                     self.log_callback("校准", "未找到校准文件，已回退到打开模式", LOG_INFO)
         if params.get('use_median'):
@@ -140,15 +262,31 @@ class ImageProcessor:
                 img = cv2.bilateralFilter(img, bilateral_d, 75, 75)
         contrast = params.get('contrast', 1.0)
         brightness = params.get('brightness', 0)
-        img = np.clip(img.astype(float) * contrast + brightness, 0, 255).astype(np.uint8)
-        if gamma := params.get('gamma'):
-            if abs(gamma - 1.0) > 0.01:
+        gamma = params.get('gamma')
+        use_gamma = bool(gamma) and abs(gamma - 1.0) > 0.01
+        if HAS_NUMBA and img.ndim == 2 and (use_gamma or contrast != 1.0 or brightness != 0):
+            # 融合内核：一次遍历完成对比度、亮度、截断和伽马
+            lut = _gamma_table(gamma) if use_gamma else _IDENTITY_LUT
+            img = _tone_map_njit(img, np.float64(contrast), np.float64(brightness), lut, np.empty_like(img))
+        else:
+            if contrast != 1.0 or brightness != 0:
+                if self._scratch_f64 is None or self._scratch_f64.shape != img.shape:
+                    self._scratch_f64 = np.empty(img.shape, dtype=np.float64)
+                scratch = self._scratch_f64
+                np.multiply(img, float(contrast), out=scratch)
+                np.add(scratch, float(brightness), out=scratch)
+                np.clip(scratch, 0, 255, out=scratch)
+                img = scratch.astype(np.uint8)
+            if use_gamma:
                 img = self.adjust_gamma(img, gamma)
         if sharpen := params.get('sharpen'):
             if sharpen > 0:
                 img = self.sharpen_image(img, sharpen)
         if colormap := params.get('colormap'):
-            img = cv2.applyColorMap(img, self.COLORMAP_MAP.get(colormap, cv2.COLORMAP_JET))
+            if img.ndim == 2:
+                img = self._colormap_lut(colormap)[img]
+            else:
+                img = cv2.applyColorMap(img, self.COLORMAP_MAP.get(colormap, cv2.COLORMAP_JET))
         if edge_method := params.get('edge_detection'):
             if edge_method != "无":
                 img = self.apply_edge_detection(img, edge_method)
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QGroupBox, QLabel, QSli
 from PySide6.QtCore import (Qt)
 
 from C import _get_combobox_style, _get_slider_style, _get_groupbox_style
-from ImageProcessor import ImageProcessor
+from ImageProcessor import ImageProcessor, ProcParams
 
 class ProcessingDialog(QDialog):
     def __init__(self, parent=None):
@@ -129,6 +129,24 @@ class ProcessingDialog(QDialog):
         size_grip_layout.addWidget(self.size_grip)
         layout.addLayout(size_grip_layout)
 
+    def current_params(self) -> ProcParams:
+        """读取当前控件值，生成处理参数快照"""
+        return ProcParams(
+            diff_mode=self.diff_combo.currentText(),
+            use_median=self.median_check.isChecked(),
+            contrast=self.contrast_slider.value() / 100.0,
+            brightness=self.brightness_slider.value(),
+            colormap=self.colormap_combo.currentText(),
+            interpolation=self.interpolation_combo.currentText(),
+            gamma=self.gamma_slider.value() / 100.0,
+            sharpen=self.sharpen_slider.value() / 10.0,
+            gaussian_blur=self.gaussian_blur_slider.value() / 10.0,
+            bilateral_filter=self.bilateral_filter_slider.value(),
+            edge_detection=self.edge_detection_combo.currentText(),
+            accumulate=self.accumulate_slider.value(),
+            advanced_enable=self.advanced_enable_check.isChecked(),
+        )
+
     def _create_slider_layout(self, label_text: str, slider: QSlider, label: QLabel):
         layout = QVBoxLayout()
         layout.setSpacing(3)
@@ -1,10 +1,16 @@
 import numpy as np
-import json
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import shutil
 
-from C import LOG_ERROR, LOG_INFO, SESSION_PARAMS_FILE, COORD_DIMENSION, create_save_session_folder
+from C import LOG_ERROR, LOG_INFO, SESSION_PARAMS_FILE, COORD_DIMENSION, create_save_session_folder, \
+    SESSION_FRAMES_B2ND_FILE, SESSION_FRAMES_NPZ_FILE, SESSION_LOG_FILE, dump_json, load_json
+
+try:
+    import blosc2
+except ImportError:
+    blosc2 = None
 
 # -------------------- SessionManager 会话管理器 --------------------
 class SessionManager:
@@ -12,6 +18,23 @@ class SessionManager:
     def __init__(self, parent_window: 'TerahertzDetectorUI'):
         self.parent = parent_window
 
+    # 处理参数 -> (控件属性名, setter名, 缩放系数)；滑块存整数，参数存浮点
+    _PARAM_MAP = (
+        ("interpolation", "interpolation_combo", "setCurrentText", 1),   # 插值方法
+        ("contrast", "contrast_slider", "setValue", 100),                 # 对比度
+        ("brightness", "brightness_slider", "setValue", 1),               # 亮度
+        ("colormap", "colormap_combo", "setCurrentText", 1),              # 伪彩色
+        ("gamma", "gamma_slider", "setValue", 100),                       # Gamma
+        ("sharpen", "sharpen_slider", "setValue", 10),                    # 锐化
+        ("gaussian_blur", "gaussian_blur_slider", "setValue", 10),        # 高斯模糊
+        ("bilateral_filter", "bilateral_filter_slider", "setValue", 1),   # 双边滤波
+        ("use_median", "median_check", "setChecked", 1),                  # 中值滤波
+        ("edge_detection", "edge_detection_combo", "setCurrentText", 1),  # 边缘检测
+        ("diff_mode", "diff_combo", "setCurrentText", 1),                 # 差分模式
+        ("accumulate", "accumulate_slider", "setValue", 1),               # 累积帧数
+        ("advanced_enable", "advanced_enable_check", "setChecked", 1),    # 高级处理启用状态
+    )
+
     def open_session(self, session_path: Path) -> bool:
         """打开会话文件夹（兼容原始结构）"""
         try:
@@ -23,11 +46,11 @@ class SessionManager:
             if not params_path.exists():
                 self.parent._log("会话", "未找到处理参数文件", LOG_ERROR)
                 return False
-            with open(params_path, 'r', encoding='utf-8') as f:
-                processing_params = json.load(f)
+            processing_params = load_json(params_path)
             # 应用到图像处理界面
             self._apply_processing_params(processing_params)
-            # 读取所有帧和坐标数据（从原始结构）
+            # 优先读取压缩帧文件（新结构），否则从每帧JSON的raw_data读取（原始结构）
+            packed_frames = self._load_packed_frames(session_path)
             frames = []
             coords = []
             fps_values = []
@@ -38,28 +61,29 @@ class SessionManager:
                 return False
             for raw_file in raw_files:
                 # 读取原始数据
-                with open(raw_file, 'r', encoding='utf-8') as f:
-                    raw_data = json.load(f)
-                    frame_array = np.array(raw_data['raw_data'], dtype=np.uint8)
-                    frames.append(frame_array)
-                    # 获取坐标数据
-                    coord_info = raw_data['coordinates']
-                    full_coord = np.zeros(COORD_DIMENSION)
-                    full_coord[0] = coord_info['position']['x']
-                    full_coord[1] = coord_info['position']['y']
-                    full_coord[2] = coord_info['position']['z']
-                    full_coord[3] = coord_info['attitude']['roll']
-                    full_coord[4] = coord_info['attitude']['pitch']
-                    full_coord[5] = coord_info['attitude']['yaw']
-                    full_coord[6] = coord_info['velocity']['vx']
-                    full_coord[7] = coord_info['velocity']['vy']
-                    full_coord[8] = coord_info['velocity']['vz']
-                    full_coord[9] = coord_info['angular_velocity']['vroll']
-                    full_coord[10] = coord_info['angular_velocity']['vpitch']
-                    full_coord[11] = coord_info['angular_velocity']['vyaw']
-                    coords.append(full_coord)
-                    # 获取FPS
-                    fps_values.append(raw_data.get('push_fps', 30.0))
+                raw_data = load_json(raw_file)
+                if packed_frames is not None:
+                    frames.append(packed_frames[len(frames)])
+                else:
+                    frames.append(np.array(raw_data['raw_data'], dtype=np.uint8))
+                # 获取坐标数据
+                coord_info = raw_data['coordinates']
+                full_coord = np.zeros(COORD_DIMENSION)
+                full_coord[0] = coord_info['position']['x']
+                full_coord[1] = coord_info['position']['y']
+                full_coord[2] = coord_info['position']['z']
+                full_coord[3] = coord_info['attitude']['roll']
+                full_coord[4] = coord_info['attitude']['pitch']
+                full_coord[5] = coord_info['attitude']['yaw']
+                full_coord[6] = coord_info['velocity']['vx']
+                full_coord[7] = coord_info['velocity']['vy']
+                full_coord[8] = coord_info['velocity']['vz']
+                full_coord[9] = coord_info['angular_velocity']['vroll']
+                full_coord[10] = coord_info['angular_velocity']['vpitch']
+                full_coord[11] = coord_info['angular_velocity']['vyaw']
+                coords.append(full_coord)
+                # 获取FPS
+                fps_values.append(raw_data.get('push_fps', 30.0))
 
             if not frames or not coords:
                 self.parent._log("会话", "未找到有效的帧或坐标数据", LOG_ERROR)
@@ -78,10 +102,10 @@ class SessionManager:
 
     def save_session(self, target_path: Path, frames: List[np.ndarray], coords: List[np.ndarray],
                      fps_values: List[float], processing_params: Dict[str, Any],
-                     log_messages: List[Dict[str, Any]]) -> bool:
+                     log_path: Optional[Path]) -> bool:
         """保存当前会话到目标文件夹（使用第一帧坐标命名，兼容原始结构）"""
         try:
-            if not frames or not coords:
+            if len(frames) == 0 or not coords:
                 self.parent._log("会话", "没有有效的数据可保存", LOG_ERROR)
                 return False
             # 使用第一帧坐标创建会话文件夹
@@ -89,8 +113,9 @@ class SessionManager:
             session_path = create_save_session_folder(first_coord, target_path)
             # 保存处理参数
             params_path = session_path / SESSION_PARAMS_FILE
-            with open(params_path, 'w', encoding='utf-8') as f:
-                json.dump(processing_params, f, ensure_ascii=False, indent=2)
+            dump_json(params_path, processing_params)
+            # 帧数据整体压缩保存，单帧JSON不再内嵌raw_data
+            packed = self._save_packed_frames(session_path, frames)
             # 保存帧和坐标数据（与PNG同目录）
             for i, (frame, coord, fps) in enumerate(zip(frames, coords, fps_values)):
                 # 保存原始数据和坐标（单个JSON）
@@ -106,67 +131,60 @@ class SessionManager:
                                              "vyaw": float(coord[11])}
                     },
                     "push_fps": float(fps),
-                    "raw_data": frame.tolist(),
                     "shape": frame.shape,
                     "dtype": str(frame.dtype)
                 }
-                with open(raw_data_path, 'w', encoding='utf-8') as f:
-                    json.dump(raw_json, f, ensure_ascii=False, indent=2)
-            # 保存日志
-            log_path = session_path / "session_log.json"
-            with open(log_path, 'w', encoding='utf-8') as f:
-                json.dump(log_messages, f, ensure_ascii=False, indent=2)
+                if not packed:
+                    raw_json["raw_data"] = frame
+                dump_json(raw_data_path, raw_json)
+            # 采集时日志已写入NDJSON文件，直接复制，不再重新序列化
+            if log_path is not None and Path(log_path).is_file():
+                shutil.copyfile(log_path, session_path / SESSION_LOG_FILE)
             self.parent._log("会话", f"会话已保存到: {session_path}", LOG_INFO)
             return True
         except Exception as e:
             self.parent._log("会话", f"保存会话失败: {e}", LOG_ERROR)
             return False
 
+    def _save_packed_frames(self, session_path: Path, frames: List[np.ndarray]) -> bool:
+        """将所有帧压缩保存为单个文件（blosc2优先，否则npz）"""
+        try:
+            stacked = np.stack(frames)
+            if blosc2 is not None:
+                packed = blosc2.pack_array2(stacked, cparams={
+                    'codec': blosc2.Codec.ZSTD,
+                    'filters': [blosc2.Filter.BITSHUFFLE],
+                    'clevel': 3
+                })
+                (session_path / SESSION_FRAMES_B2ND_FILE).write_bytes(packed)
+            else:
+                np.savez_compressed(session_path / SESSION_FRAMES_NPZ_FILE, frames=stacked)
+            return True
+        except Exception as e:
+            self.parent._log("会话", f"压缩保存帧数据失败，改用JSON保存: {e}", LOG_ERROR)
+            return False
+
+    def _load_packed_frames(self, session_path: Path):
+        """读取压缩帧文件，不存在或无法解码时返回None"""
+        b2nd_path = session_path / SESSION_FRAMES_B2ND_FILE
+        npz_path = session_path / SESSION_FRAMES_NPZ_FILE
+        try:
+            if b2nd_path.exists() and blosc2 is not None:
+                return blosc2.unpack_array2(b2nd_path.read_bytes())
+            if npz_path.exists():
+                with np.load(npz_path) as data:
+                    return data['frames']
+        except Exception as e:
+            self.parent._log("会话", f"读取压缩帧数据失败: {e}", LOG_ERROR)
+        return None
+
     def _apply_processing_params(self, params: Dict[str, Any]):
         """将处理参数应用到UI"""
         pd = self.parent.processing_dialog
-        # 插值方法
-        if 'interpolation' in params:
-            pd.interpolation_combo.setCurrentText(params['interpolation'])
-        # 对比度
-        if 'contrast' in params:
-            contrast_value = int(params['contrast'] * 100)
-            pd.contrast_slider.setValue(contrast_value)
-        # 亮度
-        if 'brightness' in params:
-            pd.brightness_slider.setValue(params['brightness'])
-        # 伪彩色
-        if 'colormap' in params:
-            pd.colormap_combo.setCurrentText(params['colormap'])
-        # Gamma
-        if 'gamma' in params:
-            gamma_value = int(params['gamma'] * 100)
-            pd.gamma_slider.setValue(gamma_value)
-        # 锐化
-        if 'sharpen' in params:
-            sharpen_value = int(params['sharpen'] * 10)
-            pd.sharpen_slider.setValue(sharpen_value)
-        # 高斯模糊
-        if 'gaussian_blur' in params:
-            blur_value = int(params['gaussian_blur'] * 10)
-            pd.gaussian_blur_slider.setValue(blur_value)
-        # 双边滤波
-        if 'bilateral_filter' in params:
-            pd.bilateral_filter_slider.setValue(params['bilateral_filter'])
-        # 中值滤波
-        if 'use_median' in params:
-            pd.median_check.setChecked(params['use_median'])
-        # 边缘检测
-        if 'edge_detection' in params:
-            pd.edge_detection_combo.setCurrentText(params['edge_detection'])
-        # 差分模式
-        if 'diff_mode' in params:
-            pd.diff_combo.setCurrentText(params['diff_mode'])
-        # 累积帧数
-        if 'accumulate' in params:
-            pd.accumulate_slider.setValue(params['accumulate'])
-
-        # ==================== 应用高级处理参数 ====================
-        # 高级处理启用状态
-        if 'advanced_enable' in params:
-            pd.advanced_enable_check.setChecked(params['advanced_enable'])
\ No newline at end of file
+        for key, widget_attr, setter_name, scale in self._PARAM_MAP:
+            value = params.get(key)
+            if value is None:
+                continue
+            setter = getattr(getattr(pd, widget_attr), setter_name)
+            # 四舍五入而非截断：0.29 * 100 = 28.999... 应还原为滑块值29
+            setter(round(value * scale) if scale != 1 else value)
\ No newline at end of file
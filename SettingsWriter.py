@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from PySide6.QtCore import QThread
+from typing import Any
+import queue
+
+from C import open_settings
+
+
+# -------------------- 后台配置写入线程 --------------------
+class SettingsWriter(QThread):
+    """
+    在独立线程中持有 QSettings 并执行写入/sync，GUI线程只负责入队
+
+    队列按批取出：一批内的多次写入只在收到 sync 请求时落盘一次
+    """
+    _SYNC = object()
+    _CLEAR = object()
+    _STOP = object()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._queue: "queue.Queue" = queue.Queue()
+
+    def enqueue(self, key: str, value: Any):
+        self._queue.put((key, value))
+
+    def request_sync(self):
+        self._queue.put(self._SYNC)
+
+    def request_clear(self):
+        self._queue.put(self._CLEAR)
+
+    def stop(self):
+        """投递结束标记并等待线程把剩余写入落盘"""
+        if self.isRunning():
+            self._queue.put(self._STOP)
+            self.wait()
+
+    def run(self):
+        settings = open_settings()
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            need_sync = stop = False
+            for item in batch:
+                if item is self._SYNC:
+                    need_sync = True
+                elif item is self._CLEAR:
+                    settings.clear()
+                elif item is self._STOP:
+                    need_sync = stop = True
+                else:
+                    settings.setValue(*item)
+            if need_sync:
+                settings.sync()
+            if stop:
+                return
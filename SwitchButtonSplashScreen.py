@@ -1,6 +1,8 @@
 from PySide6.QtWidgets import (QLabel, QApplication, QAbstractButton, QSplashScreen)
-from PySide6.QtCore import (Qt, QSettings, QPropertyAnimation, QRect, QEasingCurve, Property)
+from PySide6.QtCore import (Qt, QPropertyAnimation, QRect, QEasingCurve, Property)
 from PySide6.QtGui import (QPixmap, QPainter, QColor)
+
+from C import open_settings
 # -------------------- 12维卡尔曼滤波器 --------------------
 class SplashScreen(QSplashScreen):
     def __init__(self, logo_path: str):
@@ -20,7 +22,7 @@ class SplashScreen(QSplashScreen):
 
     def showEvent(self, event):
         super().showEvent(event)
-        settings = QSettings("T-Waves", "THZDetector")
+        settings = open_settings()
         if pos := settings.value("splash/pos"):
             self.move(pos)
         self.version_label.setGeometry(self.width() - 80, self.height() - 30, 70, 20)
@@ -15,6 +15,8 @@ class TcpServer(QObject):
     connectionChanged = Signal(bool, str)  # 连接状态、心跳状态
     connectionError = Signal(str)
     connectionQuality = Signal(float)  # 新增：连接质量（毫秒级延迟）
+    _HEADER = struct.Struct("!II")  # 包头：类型、长度
+    _COORD_STRUCT = struct.Struct("=" + "d" * COORD_DIMENSION)  # 坐标包体：COORD_DIMENSION个float64
     def __init__(self, log_callback=None):  # 添加回调参数
         super().__init__()
         self.log_callback = log_callback  # 保存回调函数
@@ -34,6 +36,12 @@ class TcpServer(QObject):
         # 新增：延迟测量相关
         self._last_packet_time = time.time()  # 上次收到数据包的时间
         self._current_delay_ms = 0.0  # 当前估算的延迟（毫秒）
+        # 帧尺寸为常量，初始化时缓存一次
+        self._expected_size = FRAME_WIDTH * FRAME_HEIGHT
+        self._frame_shape = (FRAME_HEIGHT, FRAME_WIDTH)
+        self._frame_nbytes = self._expected_size * 8  # float64
+        # 预分配坐标缓冲区：信号为同线程直连，接收端在槽内拷贝，故可逐包复用
+        self._coord_buf = np.zeros(COORD_DIMENSION, dtype=np.float64)
 
     def _on_new_connection(self):
         if self.client_socket:
@@ -120,44 +128,56 @@ class TcpServer(QObject):
             self._process_data_packets()
 
     def _process_data_packets(self):
-        """处理数据包（帧数据或坐标数据）"""
-        while len(self.read_buffer) >= 8:
-            # 读取包头
-            header = struct.unpack("!II", self.read_buffer[:8])
-            packet_type = header[0]  # 0=帧数据, 1=坐标数据
-            packet_size = header[1]
-            if len(self.read_buffer) < 8 + packet_size:
-                break
-            # 提取数据
-            packet_data = self.read_buffer[8:8 + packet_size]
-            self.read_buffer = self.read_buffer[8 + packet_size:]
-            if packet_type == 0:  # 帧数据
-                self._process_frame_data(packet_data)
-            elif packet_type == 1:  # 坐标数据
-                self._process_coordinate_data(packet_data)
+        """处理数据包（帧数据或坐标数据）
+        通过memoryview按偏移解析，包体以零拷贝视图交给处理函数，循环结束后一次性丢弃已消费字节
+        """
+        offset = 0
+        buffer_len = len(self.read_buffer)
+        with memoryview(self.read_buffer) as view:
+            while buffer_len - offset >= 8:
+                # 读取包头
+                packet_type, packet_size = self._HEADER.unpack_from(view, offset)  # 0=帧数据, 1=坐标数据
+                end = offset + 8 + packet_size
+                if buffer_len < end:
+                    break
+                # 提取数据（视图，不复制）
+                with view[offset + 8:end] as packet_data:
+                    if packet_type == 0:  # 帧数据
+                        self._process_frame_data(packet_data)
+                    elif packet_type == 1:  # 坐标数据
+                        self._process_coordinate_data(packet_data)
+                offset = end
+        if offset:
+            del self.read_buffer[:offset]
 
-    def _process_frame_data(self, data: bytes):
+    def _process_frame_data(self, data: memoryview):
         """处理帧数据"""
+        # 长度不符（残包/脏包）直接丢弃，不进入numpy
+        if len(data) != self._frame_nbytes:
+            return
         try:
-            arr = np.frombuffer(data, dtype=np.float64).copy()
-            if arr.size != FRAME_WIDTH * FRAME_HEIGHT:
-                return
-            frame_2d = arr.reshape((FRAME_HEIGHT, FRAME_WIDTH))
-            img8 = cv2.normalize(frame_2d, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
-            self.dataReceived.emit(img8)
+            frame_2d = np.frombuffer(data, dtype=np.float64, count=self._expected_size).reshape(self._frame_shape)
+            frame = cv2.normalize(frame_2d, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
         except Exception as e:
             if self.log_callback:
                 self.log_callback("帧处理", f"帧处理失败: {e}", LOG_ERROR)
+            return
+        # 每帧都下发：采集、保存和FPS统计不能丢帧；显示端自行合并渲染
+        self.dataReceived.emit(frame)
 
-    def _process_coordinate_data(self, data: bytes):
+    def _process_coordinate_data(self, data: memoryview):
         """处理坐标数据"""
         try:
             # 解析坐标数据格式: [x, y, z, roll, pitch, yaw, fps, vx, vy, vz, vroll, vpitch, vyaw] (float64)
-            arr = np.frombuffer(data, dtype=np.float64).copy()
-            if len(arr) >= 7:
-                coord = np.zeros(COORD_DIMENSION)
-                coord[:min(len(arr), COORD_DIMENSION)] = arr[:min(len(arr), COORD_DIMENSION)]
-                fps = arr[6] if len(arr) > 6 else 10.0  # 推送端FPS
+            count = len(data) // 8
+            if count >= 7:
+                coord = self._coord_buf
+                if count >= COORD_DIMENSION:
+                    coord[:] = self._COORD_STRUCT.unpack_from(data)
+                else:
+                    coord[:count] = np.frombuffer(data, dtype=np.float64, count=count)
+                    coord[count:] = 0.0
+                fps = coord[6]  # 推送端FPS
                 timestamp = time.time()
                 # 获取发送端IP
                 sender_ip = ""
@@ -192,4 +212,10 @@ class TcpServer(QObject):
 
     @property
     def is_connected(self) -> bool:
-        return self.client_socket is not None and self.client_socket.state() == QTcpSocket.ConnectedState
\ No newline at end of file
+        return self.client_socket is not None and self.client_socket.state() == QTcpSocket.ConnectedState
+
+    def send_command(self, command: bytes) -> bool:
+        """向客户端发送命令；未连接时直接返回False（不走异常路径），写入由事件循环发出，不强制flush"""
+        if not self.is_connected:
+            return False
+        return self.client_socket.write(command) == len(command)
\ No newline at end of file
@@ -1,61 +1,112 @@
 # -*- coding: utf-8 -*-
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton, QTextEdit,
                                QFileDialog, QStatusBar, QToolButton, QLabel, QSizePolicy)
-from PySide6.QtCore import (Qt, QTimer, Slot, QSettings, QByteArray)
+from PySide6.QtCore import (Qt, QTimer, Slot, Signal, QByteArray, QElapsedTimer, QThreadPool)
 from PySide6.QtGui import (QAction, QKeySequence, QCloseEvent, QTextCursor, QColor, QPixmap)
 import numpy as np
-import json
+import dataclasses
+import copy
 from pathlib import Path
-from datetime import datetime
 import ipaddress
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Deque
+import collections
 import time
+import sys
 import gc
-import psutil
 
-from C import sanitize_path, LOG_ERROR, LOG_INFO, COORD_DIMENSION, DISPLAY_SIZE, AUTO_CONNECT_DELAY_MS, \
+from C import sanitize_path, LOG_ERROR, LOG_INFO, COORD_DIMENSION, COORD_RING_SIZE, DISPLAY_SIZE, AUTO_CONNECT_DELAY_MS, \
     _get_groupbox_style, create_circle_icon, _get_button_style, LOG_LEVEL_MAP, \
-    create_square_icon, AUTO_SWITCH_THRESHOLD_MS, \
-    FPS_DIFF_THRESHOLD, DEFAULT_FRAME_COUNT, LISTEN_PORT, LOG_WARNING, LOG_DEBUG, LOG_CONFIG
+    create_square_icon, AUTO_SWITCH_THRESHOLD_MS, GC_THRESHOLDS, SETTINGS_SAVE_DELAY_MS, \
+    LOG_FLUSH_INTERVAL_MS, LOG_MAX_BLOCKS, FRAME_LABEL_INTERVAL_MS, FPS_WINDOW_FRAMES, \
+    COORD_FLUSH_COUNT, COORD_FLUSH_INTERVAL_MS, \
+    FPS_DIFF_THRESHOLD, DEFAULT_FRAME_COUNT, FRAME_HEIGHT, FRAME_WIDTH, LISTEN_PORT, LOG_WARNING, LOG_DEBUG, LOG_CONFIG, \
+    dump_json, load_json, read_rss_bytes, open_settings
+from CachedSettings import CachedSettings
 from ConnectionDialog import ConnectionDialog
-from CoorDroneWidget import DroneWidget, CoordinatePredictor
+from CoorDroneWidget import DroneWidget, CoordinatePredictor, warmup_kalman_kernels
 from FrameBuffer import FrameBuffer
-from HelpDialog import HelpDialog
-from ImageProcessor import ImageProcessor
-from OperationManualDialog import OperationManualDialog
+from FrameSaver import FrameSaver
+from FramePool import FramePool
+from ImageProcessor import ImageProcessor, ProcParams, warmup_image_kernels, opencv_optimized
 from PlaybackController import PlaybackController
 from ProcessingDialog import ProcessingDialog
 from ScalableImageLabel import ScalableImageLabel
+from SettingsWriter import SettingsWriter
 from SessionManager import SessionManager
 from TcpServer import TcpServer
 from DataSaver import DataSaver
 
+# 日志行模板（预绑定 str.format）
+_LOG_LINE = '[{}] [{}] {}: {}'.format
+_LOG_HTML = '<span style="color:{};">{}</span>'.format
+# 断开/重置时显示的零坐标（只读共享，无人机控件只读取不修改）
+_ZERO_COORD = np.zeros(COORD_DIMENSION)
+_ZERO_COORD.flags.writeable = False
+# 加载配置时区分“键不存在”与“值为None”，每个键只查一次
+_MISSING = object()
+_NO_SECTION: Dict[str, Any] = {}
+_WAITING_TEXT = "<span style='color:#999999; font-size:14px;'>等待采集...</span>"
+
 
 # -------------------- 主窗口 --------------------
 class TerahertzDetectorUI(QMainWindow):
+    # 后台线程测得内存后回到GUI线程写日志：(阶段, RSS字节, 帧数)
+    _memoryMeasured = Signal(str, object, int)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("T-Waves Inspector™ - 风电叶片太赫兹智能检测系统 v1.0.0")
+        # 界面日志先进入待显示队列，由定时器每100ms批量写入一次
+        self._log_pending: List[str] = []
+        self._log_widget_ref: Optional[QTextEdit] = None  # 日志控件创建后赋值，_log 不再做 hasattr 检查
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
         self.tcp_server = TcpServer(log_callback=self._log)
         self.image_processor = ImageProcessor(log_callback=self._log)
         # ========== 第1步：先创建settings ==========
-        self.settings = QSettings("T-Waves", "THZDetector")
+        # 写入与sync在后台线程执行，GUI线程只读缓存
+        self.settings_writer = SettingsWriter(self)
+        self.settings_writer.start()
+        self.settings = CachedSettings(open_settings(), writer=self.settings_writer)
+        # 帧写盘（PNG编码+JSON）在后台线程执行
+        self.frame_saver = FrameSaver(self)
+        self.frame_saver.start()
+        # 设置写入去抖：save_settings 只收集待写入项，空闲250ms后统一落盘（未变化的值由CachedSettings过滤）
+        self._pending_settings: Dict[str, Any] = {}
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._settings_save_timer.timeout.connect(self._flush_settings)
         # ========== 第2步：初始化其他组件 ==========
         # 初始化对话框
         self.frame_buffer = FrameBuffer()
         self.data_saver: Optional[DataSaver] = None
+        self._session_log_path: Optional[Path] = None
         self.session_manager = SessionManager(self)  # 新增：会话管理器
         # 当前帧
         self.current_frame: Optional[np.ndarray] = None
-        self.recorded_frames: List[np.ndarray] = []
+        # 采集帧缓冲区：按总帧数一次性分配 (N, H, W)，recorded_frames 为已写入部分的视图
+        self._record_buf: Optional[np.ndarray] = None
+        self._rec_i = 0
+        # 采集缓冲区池：清空时归还，下次采集复用同形状缓冲区
+        self.frame_pool = FramePool()
+        # 回放累加平均的求和/结果缓冲区，逐帧复用
+        self._playback_sum: Optional[np.ndarray] = None
+        self._playback_avg: Optional[np.ndarray] = None
         self.is_recording = False
         self.reference_frame_for_playback: Optional[np.ndarray] = None
         self.is_playback_mode = False
-        # 坐标相关
-        self.current_coordinate = np.zeros(COORD_DIMENSION)
+        # 坐标相关：预分配环形缓冲区，每个坐标包写入一行，避免逐帧分配
+        self._coord_ring = np.zeros((COORD_RING_SIZE, COORD_DIMENSION), dtype=np.float64)
+        self._last_coord_ring = np.zeros((COORD_RING_SIZE, 6), dtype=np.float64)
+        self._coord_idx = 0
+        self.current_coordinate = self._coord_ring[0]
         self.push_fps = 30.0  # 推送端FPS
         # 用于检测坐标重复
-        self.last_received_coord = np.zeros(6)
+        self.last_received_coord = self._last_coord_ring[0]
+        self._last_received_coord_bytes = self.last_received_coord.tobytes()  # 逐字节比较的快速路径
         self.coord_repeat_count = 0
         self.session_started = False
         self.waiting_for_first_coordinate = False
@@ -64,6 +115,13 @@ class TerahertzDetectorUI(QMainWindow):
         initial_fps = self.settings.value("processing/initial_fps", 30.0, type=float)
         self.coordinate_predictor = CoordinatePredictor(initial_fps=initial_fps)
         self.coordinate_predictor.log_callback = lambda msg: self._log("滤波", msg, LOG_INFO)
+        # 预编译卡尔曼内核和图像色调内核，避免第一个坐标/第一帧到达时才触发JIT编译
+        if not warmup_kalman_kernels():
+            self._log("滤波", "卡尔曼JIT内核不可用（numba线性代数需要scipy），使用numpy实现", LOG_WARNING)
+        if not warmup_image_kernels():
+            self._log("图像", "色调映射JIT内核编译失败，使用NumPy实现", LOG_WARNING)
+        if not opencv_optimized():
+            self._log("图像", "OpenCV优化内核（SIMD）未启用，图像处理会变慢", LOG_WARNING)
         # 会话创建标志位
         self.first_frame_received = False
         self.pending_session_start = False
@@ -74,20 +132,47 @@ class TerahertzDetectorUI(QMainWindow):
         # 自动重连相关
         self.fps_timer = QTimer(self)
         self.fps_timer.timeout.connect(self._update_real_fps)
-        self.fps_cnt = 0
-        self.t_start = 0
+        # 滚动窗口FPS：保存最近60帧的单调时钟时间戳
+        self._frame_ts: Deque[float] = collections.deque(maxlen=FPS_WINDOW_FRAMES)
+        # 自适应跳帧：距上次渲染结束不足一次渲染耗时的帧只更新current_frame，由定时器补渲染最新帧
+        self._render_clock = QElapsedTimer()
+        self._last_render_cost_ns = 0
+        self._frame_flush_timer = QTimer(self)
+        self._frame_flush_timer.setSingleShot(True)
+        self._frame_flush_timer.timeout.connect(self._render_latest_frame)
+        # 帧数标签限频刷新计时
+        self._frame_label_clock = QElapsedTimer()
+        # 采集坐标/FPS先暂存，满30条或500ms后一次性并入回放控制器
+        self._pending_coords: List[np.ndarray] = []
+        self._pending_fps: List[float] = []
+        self._coord_flush_timer = QTimer(self)
+        self._coord_flush_timer.setSingleShot(True)
+        self._coord_flush_timer.setInterval(COORD_FLUSH_INTERVAL_MS)
+        self._coord_flush_timer.timeout.connect(self._flush_pending_coords)
         # 新增：连接质量相关
         self._current_delay_ms = 0.0  # 当前TCP延迟（毫秒）
         self._measured_fps = 0.0  # 实际测量的FPS
         # 新增：校准模式相关
         self.is_calibration_mode = False
         self.calibration_file_path = None
+        # 开始/停止按钮图标只绘制一次，状态切换时直接复用
+        self._icon_circle_green = create_circle_icon(QColor("#4CAF50"))
+        self._icon_square_red = create_square_icon(QColor("#f44336"))
         # ==================== 第3步：创建对话框（传入self引用） ====================
         self.connection_dialog = ConnectionDialog(self, main_window=self)
         self.processing_dialog = ProcessingDialog(self)
-        # ==================== 初始化操作说明和帮助对话框 ====================
-        self.operation_manual_dialog = OperationManualDialog(self)
-        self.help_dialog = HelpDialog(self)
+        # 处理参数快照（控件变化时刷新，显示路径只读取此对象）
+        self._proc_params: ProcParams = self.processing_dialog.current_params()
+        # 由参数快照生成的处理参数字典缓存（快照对象更换时重建）
+        self._processing_params: Dict[str, Any] = {}
+        self._processing_params_src: Optional[ProcParams] = None
+        # 上次渲染的输入（帧对象、参考帧对象、参数与模式），输入未变化时跳过重绘
+        self._last_display_frame: Optional[np.ndarray] = None
+        self._last_display_ref: Optional[np.ndarray] = None
+        self._last_display_state: Optional[tuple] = None
+        # ==================== 操作说明和帮助对话框（首次打开时创建） ====================
+        self.operation_manual_dialog = None
+        self.help_dialog = None
         self._setup_ui()
         self._setup_menu()
         self._setup_status()
@@ -98,19 +183,54 @@ class TerahertzDetectorUI(QMainWindow):
         QTimer.singleShot(AUTO_CONNECT_DELAY_MS, self._auto_start_listening)
         # 连接对话框信号
         self.connection_dialog.browse_btn.clicked.connect(self.on_browse_path)
-        self.processing_dialog.interpolation_combo.currentTextChanged.connect(self.update_image_display)
-        self.processing_dialog.contrast_slider.valueChanged.connect(self.update_image_display)
-        self.processing_dialog.brightness_slider.valueChanged.connect(self.update_image_display)
-        self.processing_dialog.colormap_combo.currentTextChanged.connect(self.update_image_display)
-        self.processing_dialog.gamma_slider.valueChanged.connect(self.update_image_display)
-        self.processing_dialog.sharpen_slider.valueChanged.connect(self.update_image_display)
-        self.processing_dialog.gaussian_blur_slider.valueChanged.connect(self.update_image_display)
-        self.processing_dialog.bilateral_filter_slider.valueChanged.connect(self.update_image_display)
-        self.processing_dialog.median_check.stateChanged.connect(self.update_image_display)
-        self.processing_dialog.edge_detection_combo.currentTextChanged.connect(self.update_image_display)
-        self.processing_dialog.diff_combo.currentTextChanged.connect(self.update_image_display)
-        self.processing_dialog.accumulate_slider.valueChanged.connect(self.update_image_display)
-        self.processing_dialog.advanced_enable_check.stateChanged.connect(self.update_image_display)
+        # 参数变化合并为一次重绘：定时器未运行时才启动，拖动滑块期间约每8ms重绘一次（不推迟截止时间）
+        self._redisplay_timer = QTimer(self)
+        self._redisplay_timer.setSingleShot(True)
+        self._redisplay_timer.setInterval(8)
+        self._redisplay_timer.timeout.connect(self.update_image_display)
+        # 数值标签只随各自滑块变化更新，不在每帧显示时重写
+        dlg = self.processing_dialog
+        dlg.contrast_slider.valueChanged.connect(lambda v: dlg.contrast_value_label.setText(f"{v / 100.0:.1f}x"))
+        dlg.brightness_slider.valueChanged.connect(lambda v: dlg.brightness_value_label.setText(str(v)))
+        dlg.gamma_slider.valueChanged.connect(lambda v: dlg.gamma_value_label.setText(f"{v / 100.0:.1f}"))
+        dlg.sharpen_slider.valueChanged.connect(lambda v: dlg.sharpen_value_label.setText(f"{v / 10.0:.1f}"))
+        dlg.gaussian_blur_slider.valueChanged.connect(
+            lambda v: dlg.gaussian_blur_value_label.setText(f"{v / 10.0:.1f}"))
+        dlg.bilateral_filter_slider.valueChanged.connect(lambda v: dlg.bilateral_filter_value_label.setText(str(v)))
+        dlg.accumulate_slider.valueChanged.connect(lambda v: dlg.accumulate_value_label.setText(str(v)))
+        self._update_all_value_labels()
+        self.processing_dialog.interpolation_combo.currentTextChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.contrast_slider.valueChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.brightness_slider.valueChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.colormap_combo.currentTextChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.gamma_slider.valueChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.sharpen_slider.valueChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.gaussian_blur_slider.valueChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.bilateral_filter_slider.valueChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.median_check.stateChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.edge_detection_combo.currentTextChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.diff_combo.currentTextChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.accumulate_slider.valueChanged.connect(self._schedule_redisplay)
+        self.processing_dialog.advanced_enable_check.stateChanged.connect(self._schedule_redisplay)
+        # load_settings 在信号连接前执行，这里同步一次参数快照
+        self._proc_params = self.processing_dialog.current_params()
+        # 校准文件路径只在存储路径变化时重算
+        self.connection_dialog.path_edit.textChanged.connect(self._update_calibration_file_path)
+        self._update_calibration_file_path()
+        # 导出配置快照：相关控件变化时标记失效（处理参数在 _schedule_redisplay 中标记），导出时才重建
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._config_dirty = True
+        conn = self.connection_dialog
+        for signal in (conn.ip_edit.textChanged, conn.port_edit.textChanged, conn.path_edit.textChanged,
+                       conn.frame_count_spin.valueChanged, conn.auto_save_check.toggled,
+                       conn.calibration_mode_check.toggled, conn.kalman_mode_btn.toggled,
+                       conn.auto_switch_check.toggled):
+            signal.connect(self._invalidate_config_cache)
+        # 配置项表：导出与加载共用同一张 (分组, 键, 读取, 写入) 表
+        self._cfg_spec = self._build_config_spec()
+        # 初始化分配完成后回收一次，并调高GC阈值（手动回收只在会话边界进行）
+        gc.collect()
+        gc.set_threshold(*GC_THRESHOLDS)
 
     def _setup_ui(self):
         central = QWidget()
@@ -190,28 +310,28 @@ class TerahertzDetectorUI(QMainWindow):
         if self.connection_dialog.isVisible():
             self.connection_dialog.hide()
             self.left_open_btn.setArrowType(Qt.LeftArrow)
-            self.settings.setValue("ui/left_btn_arrow", Qt.LeftArrow)
+            self._set_setting("ui/left_btn_arrow", Qt.LeftArrow)
         else:
             self._position_dialog(self.connection_dialog, "left")  # 先定位
             self.connection_dialog.show()  # 再显示
             self.connection_dialog.raise_()
             self.connection_dialog.activateWindow()
             self.left_open_btn.setArrowType(Qt.RightArrow)
-            self.settings.setValue("ui/left_btn_arrow", Qt.RightArrow)
+            self._set_setting("ui/left_btn_arrow", Qt.RightArrow)
 
     def _toggle_processing_dialog(self):
         """切换处理对话框"""
         if self.processing_dialog.isVisible():
             self.processing_dialog.hide()
             self.right_open_btn.setArrowType(Qt.RightArrow)
-            self.settings.setValue("ui/right_btn_arrow", Qt.RightArrow)
+            self._set_setting("ui/right_btn_arrow", Qt.RightArrow)
         else:
             self._position_dialog(self.processing_dialog, "right")  # 先定位
             self.processing_dialog.show()  # 再显示
             self.processing_dialog.raise_()
             self.connection_dialog.activateWindow()
             self.right_open_btn.setArrowType(Qt.LeftArrow)
-            self.settings.setValue("ui/right_btn_arrow", Qt.LeftArrow)
+            self._set_setting("ui/right_btn_arrow", Qt.LeftArrow)
 
     def _position_dialog(self, dialog, side):
         """定位对话框到主窗口左右两侧，上边对齐图像显示区域"""
@@ -276,7 +396,7 @@ class TerahertzDetectorUI(QMainWindow):
         self.record_btn = QPushButton(" 开始采集")
         self.record_btn.setCheckable(True)
         self.record_btn.setFixedSize(115, 52)
-        self.record_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+        self.record_btn.setIcon(self._icon_circle_green)
         self.record_btn.clicked.connect(self.on_record_clicked)
         self.record_btn.setStyleSheet(_get_button_style())
         left_layout.addWidget(self.record_btn)
@@ -307,7 +427,7 @@ class TerahertzDetectorUI(QMainWindow):
         self.connect_btn = QPushButton(" 开始监听")
         self.connect_btn.setCheckable(True)
         self.connect_btn.setFixedSize(100, 52)
-        self.connect_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+        self.connect_btn.setIcon(self._icon_circle_green)
         self.connect_btn.clicked.connect(self.on_connect_clicked)
         self.connect_btn.setStyleSheet(_get_button_style())
         right_control_layout.addWidget(self.connect_btn)
@@ -376,20 +496,20 @@ class TerahertzDetectorUI(QMainWindow):
         mode_str = "理论时序" if mode else "测量时序"
         self.connection_dialog.kalman_mode_btn.setText(mode_str)  # 更新对话框按钮
         self._log("设置", f"卡尔曼滤波器模式切换为: {mode_str}", LOG_INFO)
-        self.settings.setValue("processing/kalman_fixed_mode", mode)
+        self._set_setting("processing/kalman_fixed_mode", mode)
 
     def _toggle_auto_switch(self, checked):
         """切换自动模式"""
         status = "开启" if checked else "关闭"
         self._log("设置", f"卡尔曼滤波器自动切换模式 {status}", LOG_INFO)
-        self.settings.setValue("processing/kalman_auto_switch", checked)
+        self._set_setting("processing/kalman_auto_switch", checked)
 
     def _toggle_calibration_mode(self, checked):
         """切换校准模式"""
         self.is_calibration_mode = checked
         status = "开启" if checked else "关闭"
         self._log("校准", f"校准模式 {status}", LOG_INFO)
-        self.settings.setValue("calibration_mode", checked)
+        self._set_setting("calibration_mode", checked)
         # 更新按钮文本
         if checked:
             self.record_btn.setText(" 开始校准")
@@ -436,11 +556,10 @@ class TerahertzDetectorUI(QMainWindow):
         self.log_widget.setStyleSheet("""
             QTextEdit { background-color: #fafafa; border: 1px solid #e0e0e0; border-radius: 4px; font-family: monospace; font-size: 12px; }
         """)
-        # 自动滚动到最底部
-        self.log_scroll_timer = QTimer(self)
-        self.log_scroll_timer.timeout.connect(self._scroll_log_to_bottom)
-        self.log_scroll_timer.start(100)  # 每100ms检查一次
+        # 自动滚动到最底部（仅在内容变化时检查，空闲时无开销）
+        self.log_widget.textChanged.connect(self._scroll_log_to_bottom)
         self.status_bar.addPermanentWidget(self.log_widget, 1)
+        self._log_widget_ref = self.log_widget
         self.setStatusBar(self.status_bar)
 
     def _scroll_log_to_bottom(self):
@@ -462,6 +581,7 @@ class TerahertzDetectorUI(QMainWindow):
         self.tcp_server.connectionError.connect(self.on_connection_error)
         # 新增：连接质量信号
         self.tcp_server.connectionQuality.connect(self._update_connection_quality)
+        self._memoryMeasured.connect(self._on_memory_measured, Qt.QueuedConnection)
 
     def showEvent(self, event):
         """窗口显示事件"""
@@ -484,9 +604,9 @@ class TerahertzDetectorUI(QMainWindow):
                 self._toggle_processing_dialog()
             # 恢复操作说明和帮助对话框可见性（默认为关闭）
             if self.settings.value("window/operation_manual_dialog_visible", False, type=bool):
-                self.operation_manual_dialog.show()
+                self._ensure_operation_manual_dialog().show()
             if self.settings.value("window/help_dialog_visible", False, type=bool):
-                self.help_dialog.show()
+                self._ensure_help_dialog().show()
         except Exception as e:
             self._log("设置", f"恢复对话框状态失败: {e}", LOG_ERROR)
 
@@ -554,6 +674,7 @@ class TerahertzDetectorUI(QMainWindow):
             if initial_fps := self.settings.value("processing/initial_fps", type=float):
                 self.coordinate_predictor.set_fps(initial_fps)
             self._update_all_value_labels()
+            self._proc_params = self.processing_dialog.current_params()
             self.update_image_display()
             self._log("设置", "所有配置已加载", LOG_INFO)
 
@@ -567,59 +688,78 @@ class TerahertzDetectorUI(QMainWindow):
             self._log("设置", f"加载设置时出错: {e}", LOG_ERROR)
 
     def save_settings(self):
+        """收集当前配置并安排一次延迟写入（连续调用合并为一次落盘）"""
         try:
-            self.settings.setValue("connection/ip", self.connection_dialog.ip_edit.text())
-            self.settings.setValue("connection/data_port", self.connection_dialog.port_edit.text())
-            # 移除：保存自动重启监听设置
-            self.settings.setValue("acquisition/frame_count", self.connection_dialog.frame_count_spin.value())
-            self.settings.setValue("acquisition/save_path", self.connection_dialog.path_edit.toPlainText())
-            self.settings.setValue("acquisition/auto_save", self.connection_dialog.auto_save_check.isChecked())
-            self.settings.setValue("processing/initial_fps", self.coordinate_predictor.current_fps)
-            self.settings.setValue("processing/kalman_fixed_mode", self.coordinate_predictor.use_fixed_fps)
-            self.settings.setValue("processing/kalman_auto_switch",
-                                   self.connection_dialog.auto_switch_check.isChecked())
-            self.settings.setValue("processing/interpolation", self.processing_dialog.interpolation_combo.currentText())
-            self.settings.setValue("processing/contrast", self.processing_dialog.contrast_slider.value())
-            self.settings.setValue("processing/brightness", self.processing_dialog.brightness_slider.value())
-            self.settings.setValue("processing/colormap", self.processing_dialog.colormap_combo.currentText())
-            self.settings.setValue("processing/gamma", self.processing_dialog.gamma_slider.value())
-            self.settings.setValue("processing/sharpen", self.processing_dialog.sharpen_slider.value())
-            self.settings.setValue("processing/gaussian_blur", self.processing_dialog.gaussian_blur_slider.value())
-            self.settings.setValue("processing/bilateral_filter",
-                                   self.processing_dialog.bilateral_filter_slider.value())
-            self.settings.setValue("processing/median", self.processing_dialog.median_check.isChecked())
-            self.settings.setValue("processing/edge_detection",
-                                   self.processing_dialog.edge_detection_combo.currentText())
-            # 保存差分模式
-            self.settings.setValue("processing/diff_mode", self.processing_dialog.diff_combo.currentText())
-            self.settings.setValue("processing/accumulate", self.processing_dialog.accumulate_slider.value())
-            self.settings.setValue("window/geometry", self.saveGeometry())
-            self.settings.setValue("window/state", self.saveState())
+            manual_visible = self.operation_manual_dialog is not None and self.operation_manual_dialog.isVisible()
+            help_visible = self.help_dialog is not None and self.help_dialog.isVisible()
+            values = {
+                "connection/ip": self.connection_dialog.ip_edit.text(),
+                "connection/data_port": self.connection_dialog.port_edit.text(),
+                # 移除：保存自动重启监听设置
+                "acquisition/frame_count": self.connection_dialog.frame_count_spin.value(),
+                "acquisition/save_path": self.connection_dialog.path_edit.toPlainText(),
+                "acquisition/auto_save": self.connection_dialog.auto_save_check.isChecked(),
+                "processing/initial_fps": self.coordinate_predictor.current_fps,
+                "processing/kalman_fixed_mode": self.coordinate_predictor.use_fixed_fps,
+                "processing/kalman_auto_switch": self.connection_dialog.auto_switch_check.isChecked(),
+                "processing/interpolation": self.processing_dialog.interpolation_combo.currentText(),
+                "processing/contrast": self.processing_dialog.contrast_slider.value(),
+                "processing/brightness": self.processing_dialog.brightness_slider.value(),
+                "processing/colormap": self.processing_dialog.colormap_combo.currentText(),
+                "processing/gamma": self.processing_dialog.gamma_slider.value(),
+                "processing/sharpen": self.processing_dialog.sharpen_slider.value(),
+                "processing/gaussian_blur": self.processing_dialog.gaussian_blur_slider.value(),
+                "processing/bilateral_filter": self.processing_dialog.bilateral_filter_slider.value(),
+                "processing/median": self.processing_dialog.median_check.isChecked(),
+                "processing/edge_detection": self.processing_dialog.edge_detection_combo.currentText(),
+                # 保存差分模式
+                "processing/diff_mode": self.processing_dialog.diff_combo.currentText(),
+                "processing/accumulate": self.processing_dialog.accumulate_slider.value(),
+                # ==================== 新增：保存高级处理参数 ====================
+                "processing/advanced_enable": self.processing_dialog.advanced_enable_check.isChecked(),
+                # ==================== 新增结束 ====================
+                "window/geometry": self.saveGeometry(),
+                "window/state": self.saveState(),
+                # 保存操作说明和帮助对话框状态
+                "window/operation_manual_dialog_visible": manual_visible,
+                "window/help_dialog_visible": help_visible,
+                # 保存按钮箭头状态
+                "ui/left_btn_arrow": self.left_open_btn.arrowType(),
+                "ui/right_btn_arrow": self.right_open_btn.arrowType(),
+                # 保存校准模式
+                "calibration_mode": self.is_calibration_mode,
+            }
             # 保存对话框大小
             if self.connection_dialog.isVisible():
-                self.settings.setValue("window/connection_dialog_geometry", self.connection_dialog.saveGeometry())
+                values["window/connection_dialog_geometry"] = self.connection_dialog.saveGeometry()
             if self.processing_dialog.isVisible():
-                self.settings.setValue("window/processing_dialog_geometry", self.processing_dialog.saveGeometry())
-            # 保存操作说明和帮助对话框状态
-            if self.operation_manual_dialog.isVisible():
-                self.settings.setValue("window/operation_manual_dialog_geometry",
-                                       self.operation_manual_dialog.saveGeometry())
-            if self.help_dialog.isVisible():
-                self.settings.setValue("window/help_dialog_geometry", self.help_dialog.saveGeometry())
-            self.settings.setValue("window/operation_manual_dialog_visible", self.operation_manual_dialog.isVisible())
-            self.settings.setValue("window/help_dialog_visible", self.help_dialog.isVisible())
-            # 保存按钮箭头状态
-            self.settings.setValue("ui/left_btn_arrow", self.left_open_btn.arrowType())
-            self.settings.setValue("ui/right_btn_arrow", self.right_open_btn.arrowType())
-            # 保存校准模式
-            self.settings.setValue("calibration_mode", self.is_calibration_mode)
-            self._log("设置", "所有配置已保存", LOG_INFO)
+                values["window/processing_dialog_geometry"] = self.processing_dialog.saveGeometry()
+            if manual_visible:
+                values["window/operation_manual_dialog_geometry"] = self.operation_manual_dialog.saveGeometry()
+            if help_visible:
+                values["window/help_dialog_geometry"] = self.help_dialog.saveGeometry()
+            self._pending_settings.update(values)
+            self._settings_save_timer.start()
+        except Exception as e:
+            self._log("设置", f"保存设置时出错: {e}", LOG_ERROR)
 
-            # ==================== 新增：保存高级处理参数 ====================
-            self.settings.setValue("processing/advanced_enable",
-                                   self.processing_dialog.advanced_enable_check.isChecked())
-            # ==================== 新增结束 ====================
+    def _set_setting(self, key: str, value):
+        """单项配置变更：并入待写入队列，随下一次去抖落盘"""
+        self._pending_settings[key] = value
+        self._settings_save_timer.start()
 
+    @Slot()
+    def _flush_settings(self):
+        """将待写入配置落盘，最后统一sync一次"""
+        self._settings_save_timer.stop()
+        if not self._pending_settings:
+            return
+        try:
+            for key, value in self._pending_settings.items():
+                self.settings.setValue(key, value)
+            self._pending_settings.clear()
+            self.settings.sync()
+            self._log("设置", "所有配置已保存", LOG_INFO)
         except Exception as e:
             self._log("设置", f"保存设置时出错: {e}", LOG_ERROR)
 
@@ -628,34 +768,50 @@ class TerahertzDetectorUI(QMainWindow):
         统一日志记录方法
         通过全局变量 LOG_CONFIG 控制显示位置
         """
-        level_str, color = LOG_LEVEL_MAP[level]
-        timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        log_text = f'[{timestamp}] [{level_str}] {module}: {message}'
-        # 获取对应级别的显示配置
+        # 获取对应级别的显示配置；控制台和界面都不显示时跳过时间戳与文本格式化
         level_display_flag = LOG_CONFIG[level]
-        # 控制台输出（后台）
-        if level_display_flag in (0, 2):
-            print(log_text)
-        # 界面显示
-        if level_display_flag in (1, 2):
-            if hasattr(self, 'log_widget'):
-                html = f'<span style="color:{color};">{log_text}</span>'
-                self.log_widget.append(html)
+        if level_display_flag in (0, 1, 2):
+            level_str, color = LOG_LEVEL_MAP[level]
+            now = time.time()
+            timestamp = f"{time.strftime('%H:%M:%S', time.localtime(now))}.{int(now % 1 * 1000):03d}"
+            log_text = _LOG_LINE(timestamp, level_str, module, message)
+            # 控制台输出（后台）
+            if level_display_flag in (0, 2):
+                print(log_text)
+            # 界面显示
+            if level_display_flag in (1, 2):
+                self._log_pending.append(_LOG_HTML(color, log_text))
+                if not self._log_flush_timer.isActive():
+                    self._log_flush_timer.start()
         # 文件保存（默认全部保存）
         if self.data_saver and self.data_saver.current_session_path:
             self.data_saver.log(module, message, level)
-        # 限制日志条目数（保留最后1000条）
-        if hasattr(self, 'log_widget'):
-            doc = self.log_widget.document()
-            block_count = doc.blockCount()
-            if block_count > 1000:
-                # 删除超出的块数
-                blocks_to_remove = block_count - 1000
-                cursor = QTextCursor(doc)
-                cursor.movePosition(QTextCursor.Start)
-                cursor.movePosition(QTextCursor.NextBlock, QTextCursor.MoveAnchor, blocks_to_remove)
-                cursor.movePosition(QTextCursor.Start, QTextCursor.KeepAnchor)
-                cursor.removeSelectedText()
+
+    @Slot()
+    def _flush_log(self):
+        """将待显示日志在一个编辑块内写入日志控件，并按需裁剪旧条目"""
+        if not self._log_pending or self._log_widget_ref is None:
+            return
+        pending, self._log_pending = self._log_pending, []
+        doc = self._log_widget_ref.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for i, html in enumerate(pending):
+            # 每条日志独占一个块，与 append 的行为一致
+            if i or not doc.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(html)
+        cursor.endEditBlock()
+        # 限制日志条目数：超出上限100条以上时才裁剪回上限，避免每次刷新都扫描文档
+        block_count = doc.blockCount()
+        if block_count > LOG_MAX_BLOCKS + 100:
+            blocks_to_remove = block_count - LOG_MAX_BLOCKS
+            cursor = QTextCursor(doc)
+            cursor.movePosition(QTextCursor.Start)
+            cursor.movePosition(QTextCursor.NextBlock, QTextCursor.MoveAnchor, blocks_to_remove)
+            cursor.movePosition(QTextCursor.Start, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
 
     def log(self, module: str, message: str, level: str = "info"):
         level_map = {"info": LOG_INFO, "warning": LOG_WARNING, "error": LOG_ERROR}
@@ -675,7 +831,7 @@ class TerahertzDetectorUI(QMainWindow):
             # 如果失败，确保按钮状态正确
             self.connect_btn.setChecked(False)
             self.connect_btn.setText(" 开始监听")
-            self.connect_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+            self.connect_btn.setIcon(self._icon_circle_green)
 
     @Slot()
     def on_connect_clicked(self):
@@ -697,31 +853,37 @@ class TerahertzDetectorUI(QMainWindow):
             if self.tcp_server.start_listening(ip, port):
                 self.connect_btn.setEnabled(True)
                 self.connect_btn.setText(" 停止监听")
-                self.connect_btn.setIcon(create_square_icon(QColor("#f44336")))  # 方形停止图标
+                self.connect_btn.setIcon(self._icon_square_red)  # 方形停止图标
                 self._log("监听", f"开始在 {ip}:{port} 监听", LOG_INFO)
             else:
                 self.connect_btn.setChecked(False)
                 self.connect_btn.setEnabled(True)
                 self.connect_btn.setText(" 开始监听")
-                self.connect_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+                self.connect_btn.setIcon(self._icon_circle_green)
                 self._log("监听", f"启动监听失败: {self.tcp_server.server.errorString()}", LOG_ERROR)
         except Exception as e:
             self._log("监听", f"参数错误: {e}", LOG_ERROR)
             self.connect_btn.setChecked(False)
             self.connect_btn.setEnabled(True)
             self.connect_btn.setText(" 开始监听")
-            self.connect_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+            self.connect_btn.setIcon(self._icon_circle_green)
 
     def _do_stop_listening(self):
         self.is_manual_disconnect = True
         self.tcp_server.stop_listening()
         self.connect_btn.setText(" 开始监听")
-        self.connect_btn.setIcon(create_circle_icon(QColor("#4CAF50")))  # 圆形开始图标
+        self.connect_btn.setIcon(self._icon_circle_green)  # 圆形开始图标
         # 修复监听状态不同步的问题
         self.status_label.setText("○ 未监听")
-        self.status_label.setStyleSheet("color: #f44336; font-weight: bold;")
+        self._set_status_color("#f44336")
         self._log("监听", "手动停止监听", LOG_INFO)
 
+    def _set_status_color(self, color: str):
+        """设置监听状态颜色，样式未变化时不重新解析样式表"""
+        style = f"color: {color}; font-weight: bold;"
+        if self.status_label.styleSheet() != style:
+            self.status_label.setStyleSheet(style)
+
     @Slot(bool, str)
     def on_connection_changed(self, connected: bool, heartbeat_status: str = "正常"):
         """更新连接和心跳状态（合并显示）"""
@@ -731,22 +893,21 @@ class TerahertzDetectorUI(QMainWindow):
             self.status_label.setText(status_text)
             # 根据心跳状态设置颜色
             if heartbeat_status == "正常":
-                self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+                self._set_status_color("#4CAF50")
             elif heartbeat_status == "待机":
-                self.status_label.setStyleSheet("color: #ff9800; font-weight: bold;")
+                self._set_status_color("#ff9800")
             elif heartbeat_status == "断开":
-                self.status_label.setStyleSheet("color: #f44336; font-weight: bold;")
+                self._set_status_color("#f44336")
         else:
             self.status_label.setText("○ 未监听")
-            self.status_label.setStyleSheet("color: #f44336; font-weight: bold;")
+            self._set_status_color("#f44336")
 
         if not connected:
-            self.drone_widget.set_coordinate(np.zeros(COORD_DIMENSION), "", 0.0)
+            self.drone_widget.set_coordinate(_ZERO_COORD, "", 0.0)
         self.connect_btn.setEnabled(True)
         self.connect_btn.setText(" 停止监听" if self.tcp_server.server.isListening() else " 开始监听")
         self.connect_btn.setIcon(
-            create_square_icon(QColor("#f44336")) if self.tcp_server.server.isListening() else create_circle_icon(
-                QColor("#4CAF50")))
+            self._icon_square_red if self.tcp_server.server.isListening() else self._icon_circle_green)
 
         # 新增：如果正在采集时连接断开，记录状态但不停止采集
         # 当重新连接时，需要重新发送START命令
@@ -761,12 +922,10 @@ class TerahertzDetectorUI(QMainWindow):
     def _resend_start_command(self):
         """重新发送开始采集命令"""
         if self.tcp_server.client_socket and self.is_recording:
-            try:
-                self.tcp_server.client_socket.write(b'START')
-                self.tcp_server.client_socket.flush()
+            if self.tcp_server.send_command(b'START'):
                 self._log("命令", "已重新发送 START", LOG_INFO)
-            except Exception as e:
-                self._log("命令", f"重新发送 START 失败: {e}", LOG_ERROR)
+            else:
+                self._log("命令", "重新发送 START 失败: 连接未就绪", LOG_ERROR)
 
     @Slot(str)
     def on_connection_error(self, error_msg: str):
@@ -775,10 +934,10 @@ class TerahertzDetectorUI(QMainWindow):
             self.connect_btn.setEnabled(True)
             self.connect_btn.setChecked(False)
             self.connect_btn.setText(" 开始监听")
-            self.connect_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+            self.connect_btn.setIcon(self._icon_circle_green)
             # 修复监听状态不同步的问题
             self.status_label.setText("○ 未监听")
-            self.status_label.setStyleSheet("color: #f44336; font-weight: bold;")
+            self._set_status_color("#f44336")
 
     # 移除：_trigger_auto_reconnect 方法
     # 移除：_attempt_reconnect 方法
@@ -801,21 +960,16 @@ class TerahertzDetectorUI(QMainWindow):
         try:
             if self.record_btn.isChecked():
                 # 发送开始命令
-                if self.tcp_server.client_socket:
-                    self.tcp_server.client_socket.write(b'START')
-                    self.tcp_server.client_socket.flush()
+                if self.tcp_server.send_command(b'START'):
                     self._log("命令", "已发送 START", LOG_INFO)
                 # 开始采集
                 self.start_recording()
                 # 启动FPS计时器
-                self.fps_cnt = 0
-                self.t_start = time.time()
+                self._frame_ts.clear()
                 self.fps_timer.start(1000)
             else:
                 # 发送停止命令
-                if self.tcp_server.client_socket:
-                    self.tcp_server.client_socket.write(b'STOP')
-                    self.tcp_server.client_socket.flush()
+                if self.tcp_server.send_command(b'STOP'):
                     self._log("命令", "已发送 STOP", LOG_INFO)
                 # 停止FPS计时器
                 self.fps_timer.stop()
@@ -829,7 +983,7 @@ class TerahertzDetectorUI(QMainWindow):
                 self.record_btn.setText(" 开始校准")
             else:
                 self.record_btn.setText(" 开始采集")
-            self.record_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+            self.record_btn.setIcon(self._icon_circle_green)
             self.record_status_label.setText("○ 待机")
             self.record_status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
 
@@ -843,6 +997,9 @@ class TerahertzDetectorUI(QMainWindow):
                 self.playback_controller.coords.clear()
             if hasattr(self.playback_controller, 'fps_values'):
                 self.playback_controller.fps_values.clear()
+        self._coord_flush_timer.stop()
+        self._pending_coords.clear()
+        self._pending_fps.clear()
 
         if not self.connection_dialog.path_edit.toPlainText():
             self._log("采集", "错误：未设置存储路径", LOG_ERROR)
@@ -857,15 +1014,20 @@ class TerahertzDetectorUI(QMainWindow):
             self.record_btn.setChecked(False)
             return
         # 清空采集相关的缓冲区（不影响playback_controller中的会话数据）
-        self.recorded_frames.clear()
+        self._clear_recorded_frames()
         self.frame_buffer.clear()
         # 清除回放相关数据
         self.reference_frame_for_playback = None
         self.first_frame_data = None
         self.data_saver = None
+        self._session_log_path = None
         self.is_playback_mode = False  # 退出回放模式，进入采集模式
-        # 强制垃圾回收（关键：立即释放内存）
-        gc.collect()
+        # 上面释放的缓冲区均为ndarray，引用计数归零即回收，无需手动gc.collect()
+        # 回放帧是上次采集缓冲区的视图，缓冲区即将被复用，先暂停回放
+        if self.playback_controller.is_playing:
+            self.playback_controller.toggle()
+        # 按目标帧数预分配采集缓冲区，采集过程中逐帧写入不再分配
+        self._reserve_recorded_frames(self.connection_dialog.frame_count_spin.value())
         # 记录内存状态（调试用）
         self._log_memory("采集开始")
         # 重置状态变量
@@ -881,13 +1043,53 @@ class TerahertzDetectorUI(QMainWindow):
             self.record_btn.setText(" 停止校准")
         else:
             self.record_btn.setText(" 停止采集")
-        self.record_btn.setIcon(create_square_icon(QColor("#f44336")))
+        self.record_btn.setIcon(self._icon_square_red)
         self.record_status_label.setText("● 采集中")
         self.record_status_label.setStyleSheet("color: #f44336; font-weight: bold;")
         self._log("采集", "开始采集，等待第一个坐标数据...", LOG_INFO)
         # 初始化帧数显示
         total_frames = self.connection_dialog.frame_count_spin.value()
         self.frame_counter_label.setText(f"0/{total_frames}")
+        self._frame_label_clock.invalidate()
+
+    @property
+    def recorded_frames(self) -> np.ndarray:
+        """已采集的帧（采集缓冲区中已写入部分的视图）"""
+        if self._record_buf is None:
+            return np.empty((0, FRAME_HEIGHT, FRAME_WIDTH), dtype=np.uint8)
+        return self._record_buf[:self._rec_i]
+
+    def _reserve_recorded_frames(self, frame_count: int):
+        """按帧数一次性取得 (N, H, W) 采集缓冲区（优先复用上一会话归还的缓冲区）"""
+        self.frame_pool.release(self._record_buf)
+        self._record_buf = self.frame_pool.acquire((max(1, frame_count), FRAME_HEIGHT, FRAME_WIDTH), np.uint8)
+        self._rec_i = 0
+
+    def _append_recorded_frame(self, data: np.ndarray):
+        """写入一帧到采集缓冲区（未预分配时按总帧数分配，写满时扩容）"""
+        if self._record_buf is None:
+            frame_count = max(1, self.connection_dialog.frame_count_spin.value())
+            self._record_buf = self.frame_pool.acquire((frame_count,) + data.shape, data.dtype)
+        elif self._rec_i >= len(self._record_buf):
+            grown = self.frame_pool.acquire((len(self._record_buf) * 2,) + self._record_buf.shape[1:],
+                                            self._record_buf.dtype)
+            grown[:self._rec_i] = self._record_buf
+            self.frame_pool.release(self._record_buf)
+            self._record_buf = grown
+        self._record_buf[self._rec_i] = data
+        self._rec_i += 1
+
+    def _clear_recorded_frames(self):
+        """把采集缓冲区归还缓冲区池，下次采集直接复用"""
+        self.frame_pool.release(self._record_buf)
+        self._record_buf = None
+        self._rec_i = 0
+
+    def _drop_recorded_frames(self):
+        """丢弃采集缓冲区并清空缓冲区池，内存由引用计数立即回收"""
+        self._record_buf = None
+        self._rec_i = 0
+        self.frame_pool.clear()
 
     # ========== 新增：使用给定的坐标创建会话 ==========
     def _create_session_with_coordinate(self, coord: np.ndarray):
@@ -899,20 +1101,7 @@ class TerahertzDetectorUI(QMainWindow):
             clean_path = sanitize_path(self.connection_dialog.path_edit.toPlainText())
             self.data_saver = DataSaver(clean_path)
             # 获取当前处理参数
-            processing_params = {
-                'diff_mode': self.processing_dialog.diff_combo.currentText(),
-                'use_median': self.processing_dialog.median_check.isChecked(),
-                'contrast': self.processing_dialog.contrast_slider.value() / 100.0,
-                'brightness': self.processing_dialog.brightness_slider.value(),
-                'colormap': self.processing_dialog.colormap_combo.currentText(),
-                'interpolation': self.processing_dialog.interpolation_combo.currentText(),
-                'gamma': self.processing_dialog.gamma_slider.value() / 100.0,
-                'sharpen': self.processing_dialog.sharpen_slider.value() / 10.0,
-                'gaussian_blur': self.processing_dialog.gaussian_blur_slider.value() / 10.0,
-                'bilateral_filter': self.processing_dialog.bilateral_filter_slider.value(),
-                'edge_detection': self.processing_dialog.edge_detection_combo.currentText(),
-                'accumulate': self.processing_dialog.accumulate_slider.value(),
-            }
+            processing_params = self._session_processing_params()
             self.data_saver.set_processing_params(processing_params)
             if not self.data_saver.start_session(self.current_coordinate, {
                 'frame_count': self.connection_dialog.frame_count_spin.value()
@@ -921,6 +1110,7 @@ class TerahertzDetectorUI(QMainWindow):
                 self.record_btn.setChecked(False)
                 self.stop_recording()
                 return
+            self._session_log_path = self.data_saver.log_path
         self.session_started = True
         self.waiting_for_first_coordinate = False
         # 处理缓存的第一帧
@@ -939,11 +1129,10 @@ class TerahertzDetectorUI(QMainWindow):
         self.frame_count = 1
         self.current_frame = data
         self.frame_buffer.add_frame(data)
-        self.recorded_frames.append(data)
-        # 进度更新
+        self._append_recorded_frame(data)
+        # 进度更新（只刷新帧数标签，不再逐帧写日志）
         total_frames = self.connection_dialog.frame_count_spin.value()
-        self.frame_counter_label.setText(f"{self.frame_count}/{total_frames}")
-        self._log("采集", f"已采集帧 {self.frame_count}/{total_frames}", LOG_INFO)
+        self._update_frame_counter(total_frames)
         self.update_image_display()
         self._save_current_frame()
 
@@ -952,22 +1141,30 @@ class TerahertzDetectorUI(QMainWindow):
         if not self.is_recording:
             return
         self.is_recording = False
+        # 取消跳帧后待补的渲染，避免迟到的采集帧覆盖回放的第一帧
+        self._frame_flush_timer.stop()
+        self._flush_pending_coords()
         self.image_label.set_recording(False)
         self.record_btn.setChecked(False)
         # 在校准模式下，保存校准文件
-        if self.is_calibration_mode and self.data_saver and self.recorded_frames:
+        if self.is_calibration_mode and self.data_saver and self._rec_i:
             clean_path = sanitize_path(self.connection_dialog.path_edit.toPlainText())
             base_path = Path(clean_path)
             self.data_saver.save_calibration_file(self.recorded_frames, base_path)
+            # 校准帧已重新生成，按新校准帧重绘当前画面
+            if not self._redisplay_timer.isActive():
+                self._redisplay_timer.start()
         if self.data_saver:
+            self.frame_saver.wait_idle()
             self.data_saver.end_session()
             self.data_saver = None
         self.reference_frame_for_playback = self.frame_buffer.reference_frame
         # 如果采集到了数据，自动加载到回放控制器
-        if self.recorded_frames:
-            # 将采集的数据加载到回放控制器
+        if self._rec_i:
+            # 将采集的数据加载到回放控制器：直接移交缓冲区视图，不复制；
+            # 缓冲区此后归回放使用，直到下次采集 _reserve_recorded_frames 复用它
             self.playback_controller.set_session_data(
-                self.recorded_frames.copy(),
+                self.recorded_frames,
                 self.playback_controller.coords,  # 这些是在采集过程中添加的
                 self.playback_controller.fps_values  # 这些是在采集过程中添加的
             )
@@ -986,7 +1183,7 @@ class TerahertzDetectorUI(QMainWindow):
             self.record_btn.setText(" 开始校准")
         else:
             self.record_btn.setText(" 开始采集")
-        self.record_btn.setIcon(create_circle_icon(QColor("#4CAF50")))
+        self.record_btn.setIcon(self._icon_circle_green)
         self.record_status_label.setText("○ 待机")
         self.record_status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
 
@@ -1007,14 +1204,14 @@ class TerahertzDetectorUI(QMainWindow):
             if success:
                 self.is_playback_mode = True
                 # 清除当前采集数据（避免混淆）
-                self.recorded_frames.clear()
+                self._drop_recorded_frames()
                 self.frame_buffer.clear()
 
     @Slot(np.ndarray)
     def _handle_frame(self, data: np.ndarray):
         if not self.is_recording:
             return
-        self.fps_cnt += 1
+        self._frame_ts.append(time.monotonic())
         # === 新增：如果正在等待第一个坐标，缓存第一帧 ===
         if self.waiting_for_first_coordinate:
             if self.first_frame_data is None:
@@ -1027,19 +1224,25 @@ class TerahertzDetectorUI(QMainWindow):
         self.frame_count += 1
         self.current_frame = data
         self.frame_buffer.add_frame(data)
-        self.recorded_frames.append(data)
-        # 帧数进度更新（每帧都更新）
+        self._append_recorded_frame(data)
+        # 帧数进度更新（标签限频刷新，不再逐帧写日志）
         total_frames = self.connection_dialog.frame_count_spin.value()
-        self.frame_counter_label.setText(f"{self.frame_count}/{total_frames}")
-        self._log("采集", f"已采集帧 {self.frame_count}/{total_frames}", LOG_INFO)
-        self.update_image_display()
+        self._update_frame_counter(total_frames)
+        self._render_latest_frame()
         self._save_current_frame()
-        if self.frame_count >= self.connection_dialog.frame_count_spin.value():
+        if self.frame_count >= total_frames:
             self._log("采集", f"已达到目标帧数 {self.frame_count}，自动停止", LOG_INFO)
             self.record_btn.setChecked(False)
             self.on_record_clicked()
             return
 
+    def _update_frame_counter(self, total_frames: int):
+        """刷新帧数进度标签：最多约10Hz，达到目标帧数时总是刷新"""
+        if (self.frame_count >= total_frames or not self._frame_label_clock.isValid()
+                or self._frame_label_clock.elapsed() >= FRAME_LABEL_INTERVAL_MS):
+            self.frame_counter_label.setText(f"{self.frame_count}/{total_frames}")
+            self._frame_label_clock.start()
+
     @Slot(np.ndarray, float, float, str)
     def _handle_coordinate(self, coord: np.ndarray, timestamp: float, fps: float, sender_ip: str):
         """处理接收到的坐标数据"""
@@ -1047,8 +1250,13 @@ class TerahertzDetectorUI(QMainWindow):
         self.push_fps = fps
         self.coordinate_predictor.set_fps(fps)
         # 检测坐标是否重复
-        coord_delta = np.abs(coord[:6] - self.last_received_coord)
-        is_coord_updated = np.any(coord_delta > 1e-6)
+        # 先按字节比较（48字节，无数组分配）；字节不同时再按容差判断
+        coord_bytes = coord[:6].tobytes()
+        if coord_bytes == self._last_received_coord_bytes:
+            is_coord_updated = False
+        else:
+            is_coord_updated = bool(np.any(np.abs(coord[:6] - self.last_received_coord) > 1e-6))
+        self._last_received_coord_bytes = coord_bytes
         if not is_coord_updated:
             self.coord_repeat_count += 1
             if self.coord_repeat_count == 1:
@@ -1058,11 +1266,13 @@ class TerahertzDetectorUI(QMainWindow):
                 self._log("坐标", f"坐标更新恢复，权重恢复正常", LOG_DEBUG)
             self.coord_repeat_count = 0
 
-        self.last_received_coord = coord[:6].copy()
-        # 更新卡尔曼滤波器
+        self._coord_idx += 1
+        slot = self._coord_idx % COORD_RING_SIZE
+        np.copyto(self._last_coord_ring[slot], coord[:6])
+        self.last_received_coord = self._last_coord_ring[slot]
+        # 更新卡尔曼滤波器，状态直接写入环形缓冲区对应行
         self.coordinate_predictor.update(coord[:6], timestamp, is_coord_updated)
-        full_state = self.coordinate_predictor.get_current_state()
-        self.current_coordinate = full_state
+        self.current_coordinate = self.coordinate_predictor.get_current_state(out=self._coord_ring[slot])
         # 更新无人机3D可视化
         if hasattr(self.drone_widget, 'set_coordinate'):
             self.drone_widget.set_coordinate(self.current_coordinate, sender_ip, self.push_fps)
@@ -1086,6 +1296,8 @@ class TerahertzDetectorUI(QMainWindow):
                         self._log("自动切换",
                                   f"连接质量良好（延迟:{self._current_delay_ms:.1f}ms, FPS差异:{fps_diff:.1f}），"
                                   f"切换到测量时序模式", LOG_INFO)
+        # 环形缓冲区的行会被后续坐标覆盖，采集时为回放数据保留独立副本
+        full_state = self.current_coordinate.copy() if self.is_recording else None
         # ===== 会话创建逻辑（增加超时保护）=====
         if self.waiting_for_first_coordinate and self.is_recording:
             elapsed = time.time() - self.recording_start_time
@@ -1099,8 +1311,31 @@ class TerahertzDetectorUI(QMainWindow):
                 self._log("采集", f"收到首帧坐标 {coord[:3]}，创建会话", LOG_INFO)
         # ===== 采集时保存坐标到回放控制器 =====
         if self.is_recording and self.session_started:
-            self.playback_controller.coords.append(full_state)
-            self.playback_controller.fps_values.append(fps)
+            self._pending_coords.append(full_state)
+            self._pending_fps.append(fps)
+            if len(self._pending_coords) >= COORD_FLUSH_COUNT:
+                self._flush_pending_coords()
+            elif not self._coord_flush_timer.isActive():
+                self._coord_flush_timer.start()
+
+    @Slot()
+    def _flush_pending_coords(self):
+        """把暂存的坐标/FPS批量并入回放控制器"""
+        self._coord_flush_timer.stop()
+        if self._pending_coords:
+            self.playback_controller.coords.extend(self._pending_coords)
+            self.playback_controller.fps_values.extend(self._pending_fps)
+            self._pending_coords.clear()
+            self._pending_fps.clear()
+
+    def _reset_coordinate_ring(self):
+        """清零坐标环形缓冲区并复位当前坐标视图"""
+        self._coord_ring.fill(0.0)
+        self._last_coord_ring.fill(0.0)
+        self._coord_idx = 0
+        self.current_coordinate = self._coord_ring[0]
+        self.last_received_coord = self._last_coord_ring[0]
+        self._last_received_coord_bytes = self.last_received_coord.tobytes()
 
     def _update_connection_quality(self, delay_ms: float):
         """更新连接质量显示"""
@@ -1109,23 +1344,25 @@ class TerahertzDetectorUI(QMainWindow):
     @Slot()
     def _update_real_fps(self):
         """更新实时FPS和连接质量显示"""
-        elapsed = time.time() - self.t_start
-        self._measured_fps = self.fps_cnt / elapsed if elapsed > 0 else 0
+        # 滚动窗口：(帧数-1)/首尾时间差；超过1秒没有新帧视为0
+        ts = self._frame_ts
+        if len(ts) >= 2 and time.monotonic() - ts[-1] < 1.0 and ts[-1] > ts[0]:
+            self._measured_fps = (len(ts) - 1) / (ts[-1] - ts[0])
+        else:
+            self._measured_fps = 0.0
         # 更新显示格式：xx fps + xx ms
         display_text = f"{self._measured_fps:.1f}fps {self._current_delay_ms:.1f}ms"
         self.current_fps_label.setText(display_text)
-        # 重置计数器
-        self.fps_cnt = 0
-        self.t_start = time.time()
 
     def _save_current_frame(self):
         """保存当前帧，传递完整坐标数组和推送端FPS"""
         if self.data_saver and self.current_frame is not None:
             try:
                 processed = self.process_current_frame()
-                # 传递完整的12维坐标数组和推送端FPS
-                self.data_saver.save_frame(processed, self.current_frame, self.frame_count,
-                                           self.current_coordinate, self.push_fps)
+                # 传递完整的12维坐标数组和推送端FPS；写盘在后台线程执行，坐标行会被后续坐标覆盖，入队前复制
+                if not self.frame_saver.enqueue(self.data_saver, processed, self.current_frame, self.frame_count,
+                                                self.current_coordinate.copy(), self.push_fps):
+                    self._log("保存", "磁盘写入跟不上采集速度，已丢弃最早的待保存帧", LOG_WARNING)
             except Exception as e:
                 self._log("保存", f"保存帧失败: {e}", LOG_ERROR)
 
@@ -1147,111 +1384,161 @@ class TerahertzDetectorUI(QMainWindow):
         """处理当前帧 - 修复校准文件路径问题"""
         if self.current_frame is None:
             return np.zeros((DISPLAY_SIZE, DISPLAY_SIZE, 3), dtype=np.uint8)
+        params = self._proc_params
         if self.is_recording:
-            data = self.frame_buffer.get_accumulated_frame(self.processing_dialog.accumulate_slider.value())
+            data = self.frame_buffer.get_accumulated_frame(params.accumulate)
         else:
-            accumulate_count = self.processing_dialog.accumulate_slider.value()
-            if accumulate_count > 1 and self.recorded_frames:
+            accumulate_count = params.accumulate
+            if accumulate_count > 1 and self._rec_i:
                 current_index = self.playback_controller.current_index
                 start_idx = max(0, current_index - accumulate_count + 1)
                 frames_to_average = self.recorded_frames[start_idx:current_index + 1]
                 if len(frames_to_average) > 0:
-                    data = np.mean(frames_to_average, axis=0).astype(np.uint8)
+                    # 连续缓冲区切片为视图，整数归约与整除都写入复用的缓冲区
+                    frame_shape = frames_to_average.shape[1:]
+                    if self._playback_sum is None or self._playback_sum.shape != frame_shape:
+                        self._playback_sum = np.empty(frame_shape, dtype=np.uint32)
+                        self._playback_avg = np.empty(frame_shape, dtype=np.uint8)
+                    np.add.reduce(frames_to_average, axis=0, dtype=np.uint32, out=self._playback_sum)
+                    np.floor_divide(self._playback_sum, len(frames_to_average), out=self._playback_avg,
+                                    casting='unsafe')
+                    data = self._playback_avg
                 else:
                     data = self.current_frame
             else:
                 data = self.current_frame
-        # 获取差分模式
-        diff_mode = self.processing_dialog.diff_combo.currentText()
+        # 参数字典只在参数快照更换时重建，逐帧仅更新路径和参考帧
+        if self._processing_params_src is not params:
+            self._processing_params = dataclasses.asdict(params)
+            self._processing_params_src = params
+        processing_params = self._processing_params
+        processing_params['calibration_file_path'] = self.calibration_file_path
+        processing_params['ref_frame'] = (self.frame_buffer.reference_frame if self.is_recording
+                                          else self.reference_frame_for_playback)
+        return self.image_processor.process_image(data, processing_params)
+
+    def _session_processing_params(self) -> Dict[str, Any]:
+        """会话记录用的处理参数，取自信号驱动的参数快照，不再逐个读取控件"""
+        params = dataclasses.asdict(self._proc_params)
+        del params['advanced_enable']
+        return params
+
+    @Slot()
+    def _update_calibration_file_path(self):
+        """存储路径变化时重新计算校准文件路径"""
         # 修复：校准文件路径改为保存在当前目录，而不是父目录
         clean_path = sanitize_path(self.connection_dialog.path_edit.toPlainText())
         base_path = Path(clean_path)
         # 修改：直接使用 base_path，而不是 base_path.parent
         self.calibration_file_path = str(base_path / f"{base_path.name}.json")
-        processing_params = {
-            'diff_mode': diff_mode,
-            'calibration_file_path': self.calibration_file_path,
-            'ref_frame': self.frame_buffer.reference_frame if self.is_recording else self.reference_frame_for_playback,
-            'use_median': self.processing_dialog.median_check.isChecked(),
-            'contrast': self.processing_dialog.contrast_slider.value() / 100.0,
-            'brightness': self.processing_dialog.brightness_slider.value(),
-            'colormap': self.processing_dialog.colormap_combo.currentText(),
-            'interpolation': self.processing_dialog.interpolation_combo.currentText(),
-            'gamma': self.processing_dialog.gamma_slider.value() / 100.0,
-            'sharpen': self.processing_dialog.sharpen_slider.value() / 10.0,
-            'gaussian_blur': self.processing_dialog.gaussian_blur_slider.value() / 10.0,
-            'bilateral_filter': self.processing_dialog.bilateral_filter_slider.value(),
-            'edge_detection': self.processing_dialog.edge_detection_combo.currentText(),
-
-            # ==================== 新增：高级处理参数 ====================
-            'advanced_enable': self.processing_dialog.advanced_enable_check.isChecked(),
-            # ==================== 新增结束 ====================
+        # 校准帧可能随之变化，暂停/回放时也需要重绘
+        if not self._redisplay_timer.isActive():
+            self._redisplay_timer.start()
 
-        }
-        return self.image_processor.process_image(data, processing_params)
+    @Slot()
+    def _render_latest_frame(self):
+        """渲染最新帧（采集或回放）；渲染跟不上到帧速度时合并跳过中间帧"""
+        if self._render_clock.isValid():
+            elapsed_ns = self._render_clock.nsecsElapsed()
+            if elapsed_ns < self._last_render_cost_ns:
+                if not self._frame_flush_timer.isActive():
+                    self._frame_flush_timer.start(max(1, (self._last_render_cost_ns - elapsed_ns) // 1_000_000))
+                return
+        self._frame_flush_timer.stop()
+        render_timer = QElapsedTimer()
+        render_timer.start()
+        self.update_image_display()
+        self._last_render_cost_ns = render_timer.nsecsElapsed()
+        self._render_clock.start()
+
+    @Slot()
+    def _schedule_redisplay(self):
+        """刷新处理参数快照，并请求一次合并后的重绘"""
+        self._proc_params = self.processing_dialog.current_params()
+        self._config_dirty = True
+        if not self._redisplay_timer.isActive():
+            self._redisplay_timer.start()
 
     @Slot()
     def update_image_display(self):
-        self._update_all_value_labels()
-        if self.current_frame is not None:
-            pixmap = self.image_processor.numpy_to_qpixmap(self.process_current_frame())
-            self.image_label.setPixmap(pixmap)
+        if self.current_frame is None:
+            self._last_display_frame = None
+            return
+        # 按对象身份比较帧，避免 id() 在对象释放后被复用
+        ref = self.frame_buffer.reference_frame if self.is_recording else self.reference_frame_for_playback
+        # 校准文件差分时，校准文件的路径/修改时间/大小也参与比较，更换或重新生成校准帧后会重绘
+        calib_key = (self.image_processor.calibration_key(self.calibration_file_path)
+                     if self._proc_params.diff_mode == '校准文件' else None)
+        state = (self._proc_params, self.is_recording, self.is_playback_mode, calib_key)
+        if (self.current_frame is self._last_display_frame and ref is self._last_display_ref
+                and state == self._last_display_state):
+            return
+        pixmap = self.image_processor.to_display_pixmap(self.process_current_frame())
+        self.image_label.setPixmap(pixmap)
+        self._last_display_frame = self.current_frame
+        self._last_display_ref = ref
+        self._last_display_state = state
 
     @Slot()
     def on_playback_frame(self, frame: np.ndarray):
+        # 回放定时器和进度条拖动可能快于渲染速度，与实时帧共用同一渲染节流
         self.current_frame = frame
-        self.update_image_display()
+        self._render_latest_frame()
 
     # ========== 核心修改4：改进save_session逻辑 ==========
     @Slot()
     def on_save_session(self):
         """保存当前会话（使用第一帧坐标命名）"""
-        if not self.recorded_frames:
+        if not self._rec_i:
             self._log("会话", "没有可保存的数据", LOG_WARNING)
             return
         # 如果正在采集，提示用户
         if self.is_recording:
             self._log("会话", "请先停止采集，再保存会话", LOG_WARNING)
             return
-        target_path = QFileDialog.getExistingDirectory(
-            self, "选择保存位置",
-            self.connection_dialog.path_edit.toPlainText()
+        self._open_file_dialog("选择保存位置", self.connection_dialog.path_edit.toPlainText(),
+                               self._on_session_save_path_chosen, file_mode=QFileDialog.Directory)
+
+    @Slot(str)
+    def _on_session_save_path_chosen(self, target_path: str):
+        """保存会话的续处理：对话框打开期间状态可能已变化，重新检查"""
+        if not target_path or not self._rec_i or self.is_recording:
+            return
+        # 获取当前处理参数
+        processing_params = self._session_processing_params()
+        # 最近一次采集会话的日志文件（采集时已逐条写盘）
+        log_path = self._session_log_path
+        # 保存会话（使用第一帧坐标命名）
+        success = self.session_manager.save_session(
+            Path(target_path),
+            self.recorded_frames,
+            self.playback_controller.coords,
+            self.playback_controller.fps_values,
+            processing_params,
+            log_path
         )
-        if target_path:
-            # 获取当前处理参数
-            processing_params = {
-                'diff_mode': self.processing_dialog.diff_combo.currentText(),
-                'use_median': self.processing_dialog.median_check.isChecked(),
-                'contrast': self.processing_dialog.contrast_slider.value() / 100.0,
-                'brightness': self.processing_dialog.brightness_slider.value(),
-                'colormap': self.processing_dialog.colormap_combo.currentText(),
-                'interpolation': self.processing_dialog.interpolation_combo.currentText(),
-                'gamma': self.processing_dialog.gamma_slider.value() / 100.0,
-                'sharpen': self.processing_dialog.sharpen_slider.value() / 10.0,
-                'gaussian_blur': self.processing_dialog.gaussian_blur_slider.value() / 10.0,
-                'bilateral_filter': self.processing_dialog.bilateral_filter_slider.value(),
-                'edge_detection': self.processing_dialog.edge_detection_combo.currentText(),
-                'accumulate': self.processing_dialog.accumulate_slider.value(),
-            }
-            # 获取当前日志
-            log_messages = self.data_saver.log_messages if self.data_saver else []
-            # 保存会话（使用第一帧坐标命名）
-            success = self.session_manager.save_session(
-                Path(target_path),
-                self.recorded_frames,
-                self.playback_controller.coords,
-                self.playback_controller.fps_values,
-                processing_params,
-                log_messages
-            )
-            if success:
-                self._log("会话", "会话保存成功", LOG_INFO)
+        if success:
+            self._log("会话", "会话保存成功", LOG_INFO)
+
+    def _open_file_dialog(self, title: str, directory: str, on_selected, *,
+                          file_mode=QFileDialog.ExistingFile, accept_mode=QFileDialog.AcceptOpen,
+                          name_filter: str = ""):
+        """非阻塞文件对话框：open() 不进入嵌套事件循环，TCP数据照常处理；选择结果经 fileSelected 交给续处理函数"""
+        dialog = QFileDialog(self, title, directory, name_filter)
+        dialog.setFileMode(file_mode)
+        dialog.setAcceptMode(accept_mode)
+        if file_mode == QFileDialog.Directory:
+            dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(on_selected)
+        dialog.open()
 
     @Slot()
     def on_restore_defaults(self):
         """恢复默认设置 - 修复版：确保校准模式默认为关闭"""
         try:
             self.settings.clear()
+            self._pending_settings.clear()
             self.connection_dialog.ip_edit.setText("0.0.0.0")
             self.connection_dialog.port_edit.setText(str(LISTEN_PORT))
             self.connection_dialog.frame_count_spin.setValue(DEFAULT_FRAME_COUNT)
@@ -1282,47 +1569,17 @@ class TerahertzDetectorUI(QMainWindow):
             self.processing_dialog.show()
             self._position_dialog(self.processing_dialog, "right")
             self.right_open_btn.setArrowType(Qt.LeftArrow)  # 打开后箭头向左
-            self._update_all_value_labels()
-            self.update_image_display()
-            # 停止所有定时器
-            self.fps_timer.stop()
-            self.log_scroll_timer.stop()
-            # 移除：停止重连定时器
-            # 清空所有缓存数据
-            self.recorded_frames.clear()
-            # 注意：这里不调用playback_controller.clear()，保留会话数据
-            self.frame_buffer.clear()
-            # 重置坐标和状态
-            self.current_coordinate = np.zeros(COORD_DIMENSION)
-            self.last_received_coord = np.zeros(6)
-            self.coord_repeat_count = 0
-            self.session_started = False
-            self.waiting_for_first_coordinate = False
-            self.first_frame_data = None
-            self.reference_frame_for_playback = None
-            self.is_playback_mode = False
+            # 数值标签随滑块信号更新；不再重绘：下面清空当前帧并显示等待提示
+            # 清空采集数据与运行状态（保留回放会话数据）
+            self._reset_runtime_state(keep_playback=True)
             # ==================== 关键修复：重置校准模式状态 ====================
             # 显式设置校准模式为关闭状态
             self.is_calibration_mode = False
             self.connection_dialog.calibration_mode_check.setChecked(False)
             self._toggle_calibration_mode(False)
             self.record_btn.setText(" 开始采集")  # 确保按钮文本恢复为"开始采集"
-            # 重置数据保存器并清理文件句柄
-            if self.data_saver:
-                if self.data_saver.current_session_path:
-                    self.data_saver.end_session()
-                self.data_saver = None
-            # 重置卡尔曼滤波器状态
-            self.coordinate_predictor.reset()
-            # 重置图像显示
-            self.current_frame = None
-            self.image_label.setText("<span style='color:#999999; font-size:14px;'>等待采集...</span>")
-            # 强制垃圾回收（关键：立即释放内存）
-            gc.collect()
-            # 记录内存状态
-            self._log_memory("恢复默认设置")
-            # 恢复日志滚动定时器
-            self.log_scroll_timer.start(100)
+            # 采集缓冲区与缓冲区池已释放；完整回收推迟到事件循环空闲时
+            self._schedule_full_collect("恢复默认设置")
             self._log("设置", "已恢复为默认设置并清理所有资源", LOG_INFO)
 
             # ==================== 新增：恢复高级处理默认设置 ====================
@@ -1335,161 +1592,190 @@ class TerahertzDetectorUI(QMainWindow):
     @Slot()
     def on_load_config(self):
         """加载配置文件 - 使用 JSON 格式"""
-        config_path, _ = QFileDialog.getOpenFileName(
-            self, "选择配置文件",
-            self.connection_dialog.path_edit.toPlainText(),
-            "配置文件 (*.json);;所有文件 (*.*)"
-        )
-        if config_path:
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                # 应用配置到UI
-                self._apply_config_to_ui(config)
-                self._log("配置", f"配置已加载: {config_path}", LOG_INFO)
-            except Exception as e:
-                self._log("配置", f"加载配置失败: {e}", LOG_ERROR)
+        self._open_file_dialog("选择配置文件", self.connection_dialog.path_edit.toPlainText(),
+                               self._on_config_load_path_chosen, name_filter="配置文件 (*.json);;所有文件 (*.*)")
+
+    @Slot(str)
+    def _on_config_load_path_chosen(self, config_path: str):
+        if not config_path:
+            return
+        try:
+            config = load_json(config_path)
+            # 应用配置到UI
+            self._apply_config_to_ui(config)
+            self._log("配置", f"配置已加载: {config_path}", LOG_INFO)
+        except Exception as e:
+            self._log("配置", f"加载配置失败: {e}", LOG_ERROR)
 
     @Slot()
     def on_export_config(self):
         """导出配置到 JSON 文件"""
         # 修改：默认文件名和扩展名改为 .json
         default_path = self.connection_dialog.path_edit.toPlainText() + "/config.json"
-        config_path, _ = QFileDialog.getSaveFileName(
-            self, "导出配置",
-            default_path,
-            "JSON 文件 (*.json);;所有文件 (*.*)"
-        )
-        if config_path:
-            try:
-                config = self._get_current_config()
-                # 修改：直接保存为 JSON 格式
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, ensure_ascii=False, indent=2)
-                self._log("配置", f"配置已导出: {config_path}", LOG_INFO)
-            except Exception as e:
-                self._log("配置", f"导出配置失败: {e}", LOG_ERROR)
+        self._open_file_dialog("导出配置", default_path, self._on_config_export_path_chosen,
+                               file_mode=QFileDialog.AnyFile, accept_mode=QFileDialog.AcceptSave,
+                               name_filter="JSON 文件 (*.json);;所有文件 (*.*)")
+
+    @Slot(str)
+    def _on_config_export_path_chosen(self, config_path: str):
+        if not config_path:
+            return
+        try:
+            config = self._get_current_config()
+            # 修改：直接保存为 JSON 格式（整块字节一次写入）
+            dump_json(config_path, config)
+            self._log("配置", f"配置已导出: {config_path}", LOG_INFO)
+        except Exception as e:
+            self._log("配置", f"导出配置失败: {e}", LOG_ERROR)
+
+    def _build_config_spec(self) -> List[tuple]:
+        """配置文件各项与控件的对应关系：(分组, 键, 从UI读取, 写入UI)"""
+        conn, proc = self.connection_dialog, self.processing_dialog
+        spec = [
+            ("连接", "IP", conn.ip_edit.text, conn.ip_edit.setText),
+            ("连接", "端口", conn.port_edit.text, lambda v: conn.port_edit.setText(str(v))),
+            ("采集", "总帧数", conn.frame_count_spin.value, conn.frame_count_spin.setValue),
+            ("采集", "存储路径", conn.path_edit.toPlainText, conn.path_edit.setText),
+            ("采集", "自动保存", conn.auto_save_check.isChecked, conn.auto_save_check.setChecked),
+            ("采集", "校准模式", lambda: self.is_calibration_mode, self._apply_calibration_mode),
+            # 图像处理项从参数快照读取：缩放后的浮点值在滑块信号触发时已算好，导出时不再读控件
+            ("图像处理", "插值方法", lambda: self._proc_params.interpolation, proc.interpolation_combo.setCurrentText),
+            ("图像处理", "对比度", lambda: self._proc_params.contrast,
+             lambda v: proc.contrast_slider.setValue(round(v * 100))),
+            ("图像处理", "亮度", lambda: self._proc_params.brightness, proc.brightness_slider.setValue),
+            ("图像处理", "伪彩色", lambda: self._proc_params.colormap, proc.colormap_combo.setCurrentText),
+            ("图像处理", "Gamma", lambda: self._proc_params.gamma,
+             lambda v: proc.gamma_slider.setValue(round(v * 100))),
+            ("图像处理", "锐化", lambda: self._proc_params.sharpen,
+             lambda v: proc.sharpen_slider.setValue(round(v * 10))),
+            ("图像处理", "高斯模糊", lambda: self._proc_params.gaussian_blur,
+             lambda v: proc.gaussian_blur_slider.setValue(round(v * 10))),
+            ("图像处理", "双边滤波", lambda: self._proc_params.bilateral_filter, proc.bilateral_filter_slider.setValue),
+            ("图像处理", "中值滤波", lambda: self._proc_params.use_median, proc.median_check.setChecked),
+            ("图像处理", "边缘检测", lambda: self._proc_params.edge_detection, proc.edge_detection_combo.setCurrentText),
+            ("图像处理", "差分模式", lambda: self._proc_params.diff_mode, proc.diff_combo.setCurrentText),
+            ("图像处理", "累积帧数", lambda: self._proc_params.accumulate, proc.accumulate_slider.setValue),
+            ("卡尔曼滤波", "模式", lambda: "理论时序" if self.coordinate_predictor.use_fixed_fps else "测量时序",
+             lambda v: conn.kalman_mode_btn.setChecked(v == "理论时序")),
+            ("卡尔曼滤波", "自动切换", conn.auto_switch_check.isChecked, conn.auto_switch_check.setChecked),
+        ]
+        # 驻留中文键，导出字典与表内键共用同一字符串对象（哈希只算一次）
+        return [(sys.intern(section), sys.intern(key), getter, setter) for section, key, getter, setter in spec]
+
+    def _apply_calibration_mode(self, checked: bool):
+        self.is_calibration_mode = checked
+        self.connection_dialog.calibration_mode_check.setChecked(checked)
+        self._toggle_calibration_mode(checked)
+
+    def _invalidate_config_cache(self, *_):
+        self._config_dirty = True
 
     def _get_current_config(self) -> Dict[str, Any]:
-        """获取当前配置"""
-        return {
-            "连接": {
-                "IP": self.connection_dialog.ip_edit.text(),
-                "端口": self.connection_dialog.port_edit.text(),
-                # 移除：自动重启配置
-            },
-            "采集": {
-                "总帧数": self.connection_dialog.frame_count_spin.value(),
-                "存储路径": self.connection_dialog.path_edit.toPlainText(),
-                "自动保存": self.connection_dialog.auto_save_check.isChecked(),
-                "校准模式": self.is_calibration_mode,
-            },
-            "图像处理": {
-                "插值方法": self.processing_dialog.interpolation_combo.currentText(),
-                "对比度": self.processing_dialog.contrast_slider.value() / 100.0,
-                "亮度": self.processing_dialog.brightness_slider.value(),
-                "伪彩色": self.processing_dialog.colormap_combo.currentText(),
-                "Gamma": self.processing_dialog.gamma_slider.value() / 100.0,
-                "锐化": self.processing_dialog.sharpen_slider.value() / 10.0,
-                "高斯模糊": self.processing_dialog.gaussian_blur_slider.value() / 10.0,
-                "双边滤波": self.processing_dialog.bilateral_filter_slider.value(),
-                "中值滤波": self.processing_dialog.median_check.isChecked(),
-                "边缘检测": self.processing_dialog.edge_detection_combo.currentText(),
-                "差分模式": self.processing_dialog.diff_combo.currentText(),
-                "累积帧数": self.processing_dialog.accumulate_slider.value(),
-            },
-            "卡尔曼滤波": {
-                "模式": "理论时序" if self.coordinate_predictor.use_fixed_fps else "测量时序",
-                "自动切换": self.connection_dialog.auto_switch_check.isChecked(),
-            }
-        }
+        """获取当前配置（控件未变化时返回缓存快照的副本）"""
+        if not self._config_dirty and self._config_cache is not None:
+            return copy.deepcopy(self._config_cache)
+        config: Dict[str, Dict[str, Any]] = {}
+        for section, key, getter, _ in self._cfg_spec:
+            config.setdefault(section, {})[key] = getter()
+        self._config_cache = config
+        self._config_dirty = False
+        return copy.deepcopy(self._config_cache)
 
     def _apply_config_to_ui(self, config: Dict[str, Any]):
         """将配置应用到UI"""
         try:
-            # 连接配置
-            conn_config = config.get("连接", {})
-            if "IP" in conn_config:
-                self.connection_dialog.ip_edit.setText(conn_config["IP"])
-            if "端口" in conn_config:
-                self.connection_dialog.port_edit.setText(str(conn_config["端口"]))
-            # 移除：恢复自动重启设置
-            # 采集配置
-            acq_config = config.get("采集", {})
-            if "总帧数" in acq_config:
-                self.connection_dialog.frame_count_spin.setValue(acq_config["总帧数"])
-            if "存储路径" in acq_config:
-                self.connection_dialog.path_edit.setText(acq_config["存储路径"])
-            if "自动保存" in acq_config:
-                self.connection_dialog.auto_save_check.setChecked(acq_config["自动保存"])
-            if "校准模式" in acq_config:
-                self.is_calibration_mode = acq_config["校准模式"]
-                self.connection_dialog.calibration_mode_check.setChecked(self.is_calibration_mode)
-                self._toggle_calibration_mode(self.is_calibration_mode)
-            # 图像处理配置
-            proc_config = config.get("图像处理", {})
-            if "插值方法" in proc_config:
-                self.processing_dialog.interpolation_combo.setCurrentText(proc_config["插值方法"])
-            if "对比度" in proc_config:
-                self.processing_dialog.contrast_slider.setValue(int(proc_config["对比度"] * 100))
-            if "亮度" in proc_config:
-                self.processing_dialog.brightness_slider.setValue(proc_config["亮度"])
-            if "伪彩色" in proc_config:
-                self.processing_dialog.colormap_combo.setCurrentText(proc_config["伪彩色"])
-            if "Gamma" in proc_config:
-                self.processing_dialog.gamma_slider.setValue(int(proc_config["Gamma"] * 100))
-            if "锐化" in proc_config:
-                self.processing_dialog.sharpen_slider.setValue(int(proc_config["锐化"] * 10))
-            if "高斯模糊" in proc_config:
-                self.processing_dialog.gaussian_blur_slider.setValue(int(proc_config["高斯模糊"] * 10))
-            if "双边滤波" in proc_config:
-                self.processing_dialog.bilateral_filter_slider.setValue(proc_config["双边滤波"])
-            if "中值滤波" in proc_config:
-                self.processing_dialog.median_check.setChecked(proc_config["中值滤波"])
-            if "边缘检测" in proc_config:
-                self.processing_dialog.edge_detection_combo.setCurrentText(proc_config["边缘检测"])
-            if "差分模式" in proc_config:
-                self.processing_dialog.diff_combo.setCurrentText(proc_config["差分模式"])
-            if "累积帧数" in proc_config:
-                self.processing_dialog.accumulate_slider.setValue(proc_config["累积帧数"])
-            # 卡尔曼滤波配置
-            kalman_config = config.get("卡尔曼滤波", {})
-            if "模式" in kalman_config:
-                mode = kalman_config["模式"] == "理论时序"
-                self.connection_dialog.kalman_mode_btn.setChecked(mode)
-            if "自动切换" in kalman_config:
-                self.connection_dialog.auto_switch_check.setChecked(kalman_config["自动切换"])
-            self._update_all_value_labels()
-            self.update_image_display()
+            for section, key, _, setter in self._cfg_spec:
+                value = config.get(section, _NO_SECTION).get(key, _MISSING)
+                if value is not _MISSING:
+                    setter(value)
+            # 各控件的变化信号已刷新数值标签并重启重绘定时器，整批配置只合并重绘一次
             self._log("配置", "配置已成功应用到UI", LOG_INFO)
         except Exception as e:
             self._log("配置", f"应用配置失败: {e}", LOG_ERROR)
 
+    def _ensure_operation_manual_dialog(self):
+        """首次使用时导入并创建操作说明对话框"""
+        if self.operation_manual_dialog is None:
+            from OperationManualDialog import OperationManualDialog
+            self.operation_manual_dialog = OperationManualDialog(self)
+            # 延迟创建的对话框在首次构造时恢复上次保存的几何信息
+            if geom := self.settings.value("window/operation_manual_dialog_geometry"):
+                self.operation_manual_dialog.restoreGeometry(geom)
+        return self.operation_manual_dialog
+
+    def _ensure_help_dialog(self):
+        """首次使用时导入并创建关于与支持对话框"""
+        if self.help_dialog is None:
+            from HelpDialog import HelpDialog
+            self.help_dialog = HelpDialog(self)
+            if geom := self.settings.value("window/help_dialog_geometry"):
+                self.help_dialog.restoreGeometry(geom)
+        return self.help_dialog
+
     @Slot()
     def on_user_manual(self):
         """切换操作说明对话框的显示/隐藏"""
-        if self.operation_manual_dialog.isVisible():
-            self.operation_manual_dialog.hide()
+        dialog = self._ensure_operation_manual_dialog()
+        if dialog.isVisible():
+            dialog.hide()
         else:
             # 确保对话框显示在主窗口上方
-            self.operation_manual_dialog.show()
-            self.operation_manual_dialog.raise_()
-            self.operation_manual_dialog.activateWindow()
+            dialog.show()
+            dialog.raise_()
+            dialog.activateWindow()
 
     @Slot()
     def on_help_dialog(self):
         """切换关于与支持对话框的显示/隐藏"""
-        if self.help_dialog.isVisible():
-            self.help_dialog.hide()
+        dialog = self._ensure_help_dialog()
+        if dialog.isVisible():
+            dialog.hide()
         else:
-            self.help_dialog.show()
-            self.help_dialog.raise_()
-            self.help_dialog.activate_window()
+            dialog.show()
+            dialog.raise_()
+            dialog.activate_window()
 
     def on_about(self):
         for msg in ["太赫兹探测器采集软件 v1.0.0 | © 2026 安徽中科太赫兹科技有限公司", "授权信息：专业版 | 已激活"]:
             self._log("帮助", msg, LOG_INFO)
 
+    def _reset_runtime_state(self, *, keep_playback: bool):
+        """恢复默认设置与软重启共用：停止定时器，清空采集数据、坐标状态、数据保存器和显示"""
+        if not keep_playback:
+            self.playback_controller.clear()
+        # 停止所有延迟任务并清空其待处理状态，避免重置后补渲染或补写坐标覆盖等待提示
+        self.fps_timer.stop()
+        self._frame_flush_timer.stop()
+        self._redisplay_timer.stop()
+        self._coord_flush_timer.stop()
+        self._pending_coords.clear()
+        self._pending_fps.clear()
+        self._flush_log()
+        self._log_flush_timer.stop()
+        # 清空数据缓存（不归还缓冲区池，重置后内存真正释放）
+        self._drop_recorded_frames()
+        self.frame_buffer.clear()
+        self.current_frame = None
+        self._last_display_frame = self._last_display_ref = None
+        self.reference_frame_for_playback = None
+        # 重置坐标和状态
+        self._reset_coordinate_ring()
+        self.coord_repeat_count = 0
+        self.session_started = False
+        self.waiting_for_first_coordinate = False
+        self.first_frame_data = None
+        self.is_playback_mode = False
+        # 重置数据保存器并清理文件句柄
+        if self.data_saver:
+            if self.data_saver.current_session_path:
+                self.frame_saver.wait_idle()
+                self.data_saver.end_session()
+            self.data_saver = None
+        # 重置卡尔曼滤波器（会把模式复位为理论时序而不经过控件信号，需同时作废配置快照）
+        self.coordinate_predictor.reset()
+        self._config_dirty = True
+        self.image_label.setText(_WAITING_TEXT)
+
     def restart_application(self):
         """
         软重启，保留配置，只清空数据和状态
@@ -1498,54 +1784,20 @@ class TerahertzDetectorUI(QMainWindow):
             # 停止采集和回放
             if self.is_recording:
                 self.stop_recording()
-            self.playback_controller.clear()
-
-            # 停止定时器
-            self.fps_timer.stop()
-            # 移除：停止重连定时器
-
-            # 清空数据缓存
-            self.recorded_frames.clear()
-            self.frame_buffer.clear()
-            self.current_frame = None
-            self.reference_frame_for_playback = None
-
-            # 重置坐标和状态
-            self.current_coordinate = np.zeros(COORD_DIMENSION)
-            self.last_received_coord = np.zeros(6)
-            self.coord_repeat_count = 0
-            self.session_started = False
-            self.waiting_for_first_coordinate = False
-            self.first_frame_data = None
-            self.is_playback_mode = False
-
-            # 重置数据保存器
-            if self.data_saver:
-                if self.data_saver.current_session_path:
-                    self.data_saver.end_session()
-                self.data_saver = None
-
-            # 重置卡尔曼滤波器
-            self.coordinate_predictor.reset()
+            # 清空采集数据、回放会话与运行状态
+            self._reset_runtime_state(keep_playback=False)
 
             # 重置UI状态
             self.frame_counter_label.setText("0/0")
-            self.image_label.setText("<span style='color:#999999; font-size:14px;'>等待采集...</span>")
-            self.image_label.setPixmap(QPixmap())  # 清空图像
-            self.drone_widget.set_coordinate(np.zeros(COORD_DIMENSION), "", 0.0)
+            self.image_label.setPixmap(QPixmap())  # 清空图像（等待提示已由 _reset_runtime_state 设置）
+            self.drone_widget.set_coordinate(_ZERO_COORD, "", 0.0)
 
             # 清空日志显示（可选，保留最后一条提示信息）
             self.log_widget.clear()
             self._log("重启", "所有数据已清空，系统已重置", LOG_INFO)
 
-            # 强制垃圾回收
-            gc.collect()
-
-            # 记录内存状态
-            self._log_memory("重启")
-
-            # 恢复必要定时器
-            self.log_scroll_timer.start(100)
+            # 完整垃圾回收推迟到事件循环空闲时，回收后记录内存状态
+            self._schedule_full_collect("重启")
 
             # 新增：软重启后也自动开始监听
             QTimer.singleShot(500, self._auto_start_listening)
@@ -1555,21 +1807,45 @@ class TerahertzDetectorUI(QMainWindow):
 
     def closeEvent(self, event: QCloseEvent):
         self.fps_timer.stop()
-        self.log_scroll_timer.stop()  # 停止日志滚动定时器
         self._log("退出", "正在关闭应用并保存设置...", LOG_INFO)
         self.save_settings()
-        settings = QSettings("T-Waves", "THZDetector")
-        settings.setValue("splash/pos", self.pos())
+        self.settings.setValue("splash/pos", self.pos())
+        self._flush_settings()
+        # 投递结束标记并等待后台线程落盘
+        self.settings_writer.stop()
+        self.frame_saver.stop()
         if self.tcp_server.is_connected:
             self.tcp_server.stop_listening()
         # 关闭所有对话框
         self.connection_dialog.close()
         self.processing_dialog.close()
-        self.operation_manual_dialog.close()
-        self.help_dialog.close()
+        if self.operation_manual_dialog is not None:
+            self.operation_manual_dialog.close()
+        if self.help_dialog is not None:
+            self.help_dialog.close()
         event.accept()
 
+    def _schedule_full_collect(self, phase: str):
+        """先做第0代回收，完整回收与内存日志排到按钮处理结束之后"""
+        gc.collect(0)
+
+        def _collect():
+            gc.collect(2)
+            self._log_memory(phase)
+        QTimer.singleShot(0, _collect)
+
     def _log_memory(self, phase: str):
-        process = psutil.Process()
-        mem_info = process.memory_info()
-        self._log("内存", f"{phase}: RSS={mem_info.rss // 1024 ** 2}MB, 帧数={len(self.recorded_frames)}", LOG_INFO)
\ No newline at end of file
+        """在线程池中读取RSS，结果经信号排队回GUI线程写日志"""
+        frame_count = self._rec_i
+
+        def _measure():
+            try:
+                rss = read_rss_bytes()
+            except Exception:
+                return
+            self._memoryMeasured.emit(phase, rss, frame_count)
+        QThreadPool.globalInstance().start(_measure)
+
+    @Slot(str, object, int)
+    def _on_memory_measured(self, phase: str, rss: int, frame_count: int):
+        self._log("内存", f"{phase}: RSS={rss // 1024 ** 2}MB, 帧数={frame_count}", LOG_INFO)
\ No newline at end of file
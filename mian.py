@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 from PySide6.QtWidgets import (QApplication)
-from PySide6.QtCore import (QTimer)
+from PySide6.QtCore import (QTimer, QSocketNotifier)
 from PySide6.QtGui import (QColor, QPalette)
 import sys
 import signal
+import socket
 
-from C import (LOGO_PATH)
+from C import (LOGO_PATH, migrate_native_settings)
 from SwitchButtonSplashScreen import SplashScreen
 from TerahertzDetectorUI import TerahertzDetectorUI
 # -------------------- main --------------------
@@ -16,6 +17,8 @@ if __name__ == "__main__":
     palette.setColor(QPalette.Window, QColor("#ffffff"))
     palette.setColor(QPalette.WindowText, QColor("#333333"))
     app.setPalette(palette)
+    # 配置改存INI文件，首次启动时迁移原生格式中的旧配置
+    migrate_native_settings()
     # 创建主窗口
     window = TerahertzDetectorUI()
     # 信号处理函数
@@ -27,9 +30,19 @@ if __name__ == "__main__":
     # 显示启动画面
     splash = SplashScreen(LOGO_PATH)
     splash.show()
-    # 定时检查信号（让Python能处理信号）
-    timer = QTimer()
-    timer.start(200)  # 每200ms触发一次
-    timer.timeout.connect(lambda: None)  # 空操作，只是为了让Python处理信号
+    # 信号唤醒：C层信号处理写入自管道，事件循环被唤醒后Python处理器才执行，无需周期定时器
+    wakeup_r, wakeup_w = socket.socketpair()
+    wakeup_r.setblocking(False)
+    wakeup_w.setblocking(False)
+    signal.set_wakeup_fd(wakeup_w.fileno())
+
+    def _drain_wakeup():
+        try:
+            while wakeup_r.recv(64):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+    wakeup_notifier = QSocketNotifier(wakeup_r.fileno(), QSocketNotifier.Read)
+    wakeup_notifier.activated.connect(_drain_wakeup)
     QTimer.singleShot(1100, lambda: [splash.close(), window.show()])
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from SessionManager import SessionManager
+
+
+class _Widget:
+    """记录setter收到的值，代替处理对话框中的控件"""
+    def __init__(self):
+        self.value = None
+
+    def _set(self, value):
+        self.value = value
+
+    setValue = setCurrentText = setChecked = _set
+
+
+class ApplyProcessingParamsTest(unittest.TestCase):
+    def test_scaled_values_round_trip(self):
+        # 滑块值 29 保存为 0.29，重新打开会话时应还原为 29 而不是截断为 28
+        dialog = SimpleNamespace(**{attr: _Widget() for _, attr, _, _ in SessionManager._PARAM_MAP})
+        manager = SessionManager(SimpleNamespace(processing_dialog=dialog))
+        manager._apply_processing_params({"contrast": 29 / 100.0, "gamma": 0.29,
+                                          "sharpen": 0.7, "gaussian_blur": 2.3})
+        self.assertEqual(dialog.contrast_slider.value, 29)
+        self.assertEqual(dialog.gamma_slider.value, 29)
+        self.assertEqual(dialog.sharpen_slider.value, 7)
+        self.assertEqual(dialog.gaussian_blur_slider.value, 23)
+
+
+if __name__ == "__main__":
+    unittest.main()